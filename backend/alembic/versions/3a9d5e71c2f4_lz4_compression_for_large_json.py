@@ -0,0 +1,50 @@
+"""lz4 compression for large json columns
+
+Revision ID: 3a9d5e71c2f4
+Revises: 817e4c6c0bc2
+Create Date: 2026-10-15 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d5e71c2f4'
+down_revision: Union[str, None] = '817e4c6c0bc2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Agent state payloads that are routinely large enough to be TOASTed
+LARGE_JSON_COLUMNS = [
+    ('hitl_reviews', 'content_snapshot'),
+    ('tasks', 'input_data'),
+    ('tasks', 'output_data'),
+    ('task_steps', 'input_data'),
+    ('task_steps', 'output_data'),
+    ('task_steps', 'token_usage'),
+]
+
+
+def _supports_column_compression() -> bool:
+    """Per-column compression is PostgreSQL 14+ only."""
+    bind = op.get_bind()
+    return bind.dialect.name == 'postgresql' and bind.dialect.server_version_info >= (14,)
+
+
+def upgrade() -> None:
+    # Only newly written values use lz4; existing rows keep pglz until they are
+    # rewritten (VACUUM FULL / pg_repack on the affected tables).
+    if not _supports_column_compression():
+        return
+    for table, column in LARGE_JSON_COLUMNS:
+        op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4'))
+
+
+def downgrade() -> None:
+    if not _supports_column_compression():
+        return
+    for table, column in LARGE_JSON_COLUMNS:
+        op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz'))
@@ -0,0 +1,33 @@
+"""partial index on pending hitl reviews
+
+Revision ID: b7e2c4f0d915
+Revises: 3a9d5e71c2f4
+Create Date: 2026-10-15 10:48:03.114527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c4f0d915'
+down_revision: Union[str, None] = '3a9d5e71c2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_hitl_reviews_pending',
+        'hitl_reviews',
+        ['deadline_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hitl_reviews_pending', table_name='hitl_reviews')
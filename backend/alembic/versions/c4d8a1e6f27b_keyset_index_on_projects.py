@@ -0,0 +1,30 @@
+"""keyset index on projects
+
+Revision ID: c4d8a1e6f27b
+Revises: b7e2c4f0d915
+Create Date: 2026-10-15 14:22:51.607318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8a1e6f27b'
+down_revision: Union[str, None] = 'b7e2c4f0d915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_projects_created_at_id',
+        'projects',
+        ['created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
@@ -1,6 +1,8 @@
 """Base agent abstract class - core of the AIDEN agent framework."""
 
 from __future__ import annotations
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Type
 
@@ -21,6 +23,16 @@ class BaseAgent(ABC):
     for a specific development phase (analysis, design, development, testing).
     """
 
+    # Compiled graphs shared across instances with the same class and runtime
+    # dependencies (the app-scoped LLM provider / RAG pipeline singletons)
+    GRAPH_CACHE_SIZE = 32
+    _graph_cache: Dict[tuple, Any] = {}
+    # One lock per running event loop, created on first use; an asyncio.Lock
+    # made at import time would be bound to whichever loop touched it first
+    _graph_cache_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         agent_name: str,
@@ -63,11 +75,41 @@ class BaseAgent(ABC):
         """
         return []
 
+    @classmethod
+    def _graph_cache_lock(cls) -> asyncio.Lock:
+        """Lock serialising graph compilation on the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = BaseAgent._graph_cache_locks.get(loop)
+        if lock is None:
+            lock = BaseAgent._graph_cache_locks[loop] = asyncio.Lock()
+        return lock
+
+    def _graph_cache_key(self) -> tuple:
+        """Key identifying what the compiled graph closes over."""
+        return (type(self), self.llm_provider, self.rag_pipeline)
+
     async def compile(self) -> Any:
         """Compile the LangGraph with appropriate checkpointer.
 
         Uses MemorySaver in SQLite dev mode, AsyncPostgresSaver in production.
+        The compiled graph is cached per agent class and dependencies, so
+        repeated executions (and HITL resumes) reuse one graph and checkpointer.
         """
+        key = self._graph_cache_key()
+        async with self._graph_cache_lock():
+            cached = self._graph_cache.get(key)
+            if cached is None:
+                cached = await self._build_compiled_graph()
+                if len(self._graph_cache) >= self.GRAPH_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._graph_cache.pop(next(iter(self._graph_cache)))
+                self._graph_cache[key] = cached
+
+        self._compiled_graph = cached
+        return self._compiled_graph
+
+    async def _build_compiled_graph(self) -> Any:
+        """Build and compile a fresh graph for this agent."""
         builder = StateGraph(self.get_state_class())
         builder = self.build_graph(builder)
 
@@ -82,13 +124,13 @@ class BaseAgent(ABC):
             checkpointer = AsyncPostgresSaver.from_conn_string(settings.database_url)
             await checkpointer.setup()
 
-        self._compiled_graph = builder.compile(
+        compiled_graph = builder.compile(
             checkpointer=checkpointer,
             interrupt_before=interrupt_nodes if interrupt_nodes else None,
         )
 
         logger.info(f"Agent '{self.agent_name}' compiled successfully")
-        return self._compiled_graph
+        return compiled_graph
 
     async def execute(
         self,
@@ -49,8 +49,7 @@ async def get_agent_logs(
         .offset(offset)
         .limit(page_size)
     )
-    result = await db.execute(stmt)
-    logs = list(result.scalars().all())
+    logs = (await db.scalars(stmt)).all()
 
     return PaginatedResponse(
         data=[AgentLogResponse.model_validate(log) for log in logs],
@@ -32,5 +32,10 @@ async def get_deliverable(deliverable_id: UUID, db: DBSession):
 async def list_deliverable_versions(deliverable_id: UUID, db: DBSession):
     """Get version history for a deliverable."""
     service = DeliverableService(db)
-    versions = await service.get_versions(deliverable_id)
-    return SuccessResponse(data=[DeliverableVersionResponse.model_validate(v) for v in versions])
+    # The deliverable's format decides whether empty content is rendered from
+    # content_structured; its versions are selectin-loaded in version order
+    deliverable = await service.get_deliverable(deliverable_id)
+    context = {"format": deliverable.format}
+    return SuccessResponse(data=[
+        DeliverableVersionResponse.model_validate(v, context=context) for v in deliverable.versions
+    ])
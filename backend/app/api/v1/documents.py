@@ -26,9 +26,8 @@ async def upload_document(
     doc_type: str = Form(default="dev_request"),
 ):
     """Upload a document to a project and ingest into RAG pipeline."""
-    # Validate file size
-    content = await file.read()
-    if len(content) > settings.max_upload_size_bytes:
+    # Validate file size (known from the parsed multipart body, without reading it)
+    if file.size is not None and file.size > settings.max_upload_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File size exceeds maximum of {settings.max_upload_size_mb}MB",
@@ -40,7 +39,7 @@ async def upload_document(
         title=title,
         doc_type=doc_type,
         file_name=file.filename or "unnamed",
-        file_content=content,
+        file=file,
         mime_type=file.content_type or "application/octet-stream",
         uploaded_by=user_id,
     )
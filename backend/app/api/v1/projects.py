@@ -1,9 +1,13 @@
 """Project management API endpoints."""
 
+import base64
+import hashlib
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
 
+from app.core.exceptions import ValidationError
 from app.dependencies import (
     CurrentUserID,
     DBSession,
@@ -13,6 +17,9 @@ from app.dependencies import (
 )
 from app.schemas.common import PaginatedResponse, SuccessResponse
 from app.schemas.project import (
+    PROJECT_DETAIL_ADAPTER,
+    PROJECT_DETAIL_ENVELOPE_ADAPTER,
+    PROJECT_LIST_ADAPTER,
     ProjectCreate,
     ProjectDetailResponse,
     ProjectListResponse,
@@ -31,31 +38,71 @@ async def create_project(data: ProjectCreate, db: DBSession, user_id: CurrentUse
     await db.flush()
     # Re-fetch with selectinload to eagerly load phases for serialization
     project = await service.get_project(project.id)
-    return SuccessResponse(data=ProjectDetailResponse.model_validate(project))
+    return SuccessResponse(data=PROJECT_DETAIL_ADAPTER.validate_python(project, from_attributes=True))
+
+
+def _encode_cursor(project) -> str:
+    """Opaque keyset cursor for the page following ``project``."""
+    raw = f"{project.created_at.isoformat()}|{project.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, project_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(project_id)
+    except ValueError:
+        raise ValidationError("Invalid pagination cursor", details={"cursor": cursor})
 
 
 @router.get("", response_model=PaginatedResponse[ProjectListResponse])
 async def list_projects(
     db: DBSession,
-    page: int = Query(1, ge=1),
+    cursor: str | None = Query(None, description="meta.next_cursor from the previous page"),
     page_size: int = Query(20, ge=1, le=100),
 ):
-    """List all projects with pagination."""
+    """List projects newest first, paginated by cursor."""
     service = ProjectService(db)
-    offset = (page - 1) * page_size
-    projects, total = await service.list_projects(offset=offset, limit=page_size)
+    projects, total = await service.list_projects(
+        cursor=_decode_cursor(cursor) if cursor else None, limit=page_size,
+    )
+    next_cursor = _encode_cursor(projects[-1]) if len(projects) == page_size else None
     return PaginatedResponse(
-        data=[ProjectListResponse.model_validate(p) for p in projects],
-        meta={"page": page, "page_size": page_size, "total": total},
+        data=PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True),
+        meta={"page_size": page_size, "total": total, "next_cursor": next_cursor},
     )
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 13.1.2): ``*`` or any tag ignoring ``W/``."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 @router.get("/{project_id}", response_model=SuccessResponse[ProjectDetailResponse])
-async def get_project(project_id: UUID, db: DBSession):
-    """Get project details with phases."""
+async def get_project(
+    project_id: UUID,
+    db: DBSession,
+    if_none_match: str | None = Header(None),
+):
+    """Get project details with phases.
+
+    The ETag is a hash of the serialized body, so it changes exactly when the
+    response does; a matching If-None-Match gets a 304 without a body. The
+    project is still loaded and serialized on every request, so a 304 only
+    saves the transfer.
+    """
     service = ProjectService(db)
     project = await service.get_project(project_id)
-    return SuccessResponse(data=ProjectDetailResponse.model_validate(project))
+    envelope = SuccessResponse(
+        data=PROJECT_DETAIL_ADAPTER.validate_python(project, from_attributes=True),
+    )
+    body = PROJECT_DETAIL_ENVELOPE_ADAPTER.dump_json(envelope)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.patch("/{project_id}", response_model=SuccessResponse[ProjectDetailResponse])
@@ -65,7 +112,7 @@ async def update_project(project_id: UUID, data: ProjectUpdate, db: DBSession):
     await service.update_project(project_id, data)
     # Re-fetch with selectinload to eagerly load phases for serialization
     project = await service.get_project(project_id)
-    return SuccessResponse(data=ProjectDetailResponse.model_validate(project))
+    return SuccessResponse(data=PROJECT_DETAIL_ADAPTER.validate_python(project, from_attributes=True))
 
 
 @router.delete("/{project_id}", response_model=SuccessResponse[dict])
@@ -87,7 +134,8 @@ async def start_project(
     """Start the project workflow via the OrchestrationEngine.
 
     This triggers the analysis phase, dispatching the Ryan agent
-    to process uploaded documents and generate requirements.
+    to process uploaded documents and generate requirements. The agent
+    runs in the background; progress is streamed over the WebSocket.
     """
     from app.orchestration.engine import OrchestrationEngine
 
@@ -97,4 +145,4 @@ async def start_project(
     # Re-fetch with selectinload so phases are eagerly loaded
     service = ProjectService(db)
     project = await service.get_project(project_id)
-    return SuccessResponse(data=ProjectDetailResponse.model_validate(project))
+    return SuccessResponse(data=PROJECT_DETAIL_ADAPTER.validate_python(project, from_attributes=True))
@@ -4,10 +4,12 @@ import asyncio
 import json
 from typing import Dict, List
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
 from app.core.logging import get_logger
 from app.orchestration.event_bus import EventBus
+from app.schemas.websocket import WSMessage
 
 logger = get_logger("api.websocket")
 
@@ -52,14 +54,24 @@ class ConnectionManager:
                     self._subscriber_tasks[project_id].cancel()
                     del self._subscriber_tasks[project_id]
 
-    async def broadcast_to_project(self, project_id: str, message: dict) -> None:
-        """Send a message to all WebSocket clients subscribed to a project."""
+    async def broadcast_to_project(self, project_id: str, message: dict | WSMessage) -> None:
+        """Send a message to all WebSocket clients subscribed to a project.
+
+        The message is serialized once and the same text frame is sent to
+        every subscriber.
+        """
         connections = self.active_connections.get(project_id, [])
+        if not connections:
+            return
+        if isinstance(message, WSMessage):
+            payload = message.model_dump_json()
+        else:
+            payload = orjson.dumps(message, default=str).decode()
         dead_connections = []
 
-        for connection in connections:
+        for connection in list(connections):
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception:
                 dead_connections.append(connection)
 
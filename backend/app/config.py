@@ -48,6 +48,13 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    event_stream_maxlen: int = Field(
+        default=10_000, description="Approximate cap on entries kept in the admin event stream"
+    )
+    event_stream_max_payload_bytes: int = Field(
+        default=16_384,
+        description="Stream copies of larger events are stored without their agent state",
+    )
 
     # ChromaDB
     chroma_host: str = "localhost"
@@ -69,6 +76,10 @@ class Settings(BaseSettings):
     embedding_model: str = "text-embedding-3-small"
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    use_native_chunker: bool = Field(
+        default=True,
+        description="Split with the Rust semantic-text-splitter; False falls back to LangChain's splitter",
+    )
 
     # Auth
     jwt_secret_key: str = "change-me-in-production"
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Annotated, Any
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_access_token
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
     from app.rag.pipeline import RAGPipeline
 
 security_scheme = HTTPBearer(auto_error=False)
+_USER_ID_ADAPTER = TypeAdapter(UUID)
 
 # Type aliases for dependency injection
 DBSession = Annotated[AsyncSession, Depends(get_db)]
@@ -23,8 +26,11 @@ DBSession = Annotated[AsyncSession, Depends(get_db)]
 
 async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
-) -> str | None:
-    """Extract current user ID from JWT token. Returns None if no token."""
+) -> UUID | None:
+    """Extract current user ID from JWT token. Returns None if no token.
+
+    The ID is parsed here once, so services receive a ``UUID``.
+    """
     if credentials is None:
         return None
 
@@ -34,10 +40,19 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
-    return payload.get("sub")
+    sub = payload.get("sub")
+    if sub is None:
+        return None
+    try:
+        return _USER_ID_ADAPTER.validate_python(sub)
+    except ValidationError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token subject",
+        )
 
 
-CurrentUserID = Annotated[str | None, Depends(get_current_user_id)]
+CurrentUserID = Annotated[UUID | None, Depends(get_current_user_id)]
 
 
 # ---------------------------------------------------------------------------
@@ -51,11 +51,20 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    try:
+        await app.state.event_bus.close()
+    except Exception as e:
+        print(f"Warning: Event bus shutdown failed: {e}")
+
     try:
         await close_redis()
     except Exception as e:
         print(f"Warning: Redis shutdown failed: {e}")
 
+    from app.rag.loaders._pool import shutdown_loader_pool
+
+    shutdown_loader_pool()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
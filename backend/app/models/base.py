@@ -16,11 +16,20 @@ class Base(DeclarativeBase):
     pass
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamps."""
 
+    # Set client-side so the value carries microseconds on every backend
+    # (SQLite's CURRENT_TIMESTAMP is whole seconds); list_projects pages by
+    # (created_at, id) and needs stored values to round-trip exactly.
+    # server_default still covers rows inserted outside the ORM.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
         nullable=False,
     )
@@ -31,7 +31,11 @@ class Document(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     # Relationships
     project = relationship("Project", back_populates="documents")
-    chunks = relationship("DocumentChunk", back_populates="document", lazy="selectin")
+    # Can be thousands of rows; load explicitly with selectinload(Document.chunks) when needed.
+    # Chunk rows are removed by the ON DELETE CASCADE foreign key, not the ORM.
+    chunks = relationship(
+        "DocumentChunk", back_populates="document", lazy="raise", passive_deletes=True,
+    )
 
 
 class DocumentChunk(Base, UUIDPrimaryKeyMixin, TimestampMixin):
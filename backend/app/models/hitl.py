@@ -3,7 +3,7 @@
 from __future__ import annotations
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,15 @@ from app.models.base import JSONB_COMPAT as JSONB, Base, TimestampMixin, UUIDPri
 
 class HITLReview(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "hitl_reviews"
+    __table_args__ = (
+        # Most reviews are resolved; only index the open queue, ordered by deadline
+        Index(
+            "ix_hitl_reviews_pending",
+            "deadline_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
 
     execution_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("agent_executions.id"), nullable=True
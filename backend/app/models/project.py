@@ -3,7 +3,7 @@
 from __future__ import annotations
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,10 @@ from app.models.base import JSONB_COMPAT as JSONB, Base, TimestampMixin, UUIDPri
 
 class Project(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination key for list_projects (newest first, id breaks ties)
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
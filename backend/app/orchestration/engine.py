@@ -5,11 +5,13 @@ It dispatches agents, handles phase transitions, and coordinates HITL reviews.
 """
 
 from __future__ import annotations
+import asyncio
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.agents import get_agent_class
 from app.agents.base.agent import BaseAgent
@@ -28,6 +30,9 @@ from app.services.deliverable_service import DeliverableService
 
 logger = get_logger("orchestration.engine")
 
+# Strong references to detached phase runs so they are not garbage-collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
 
 class OrchestrationEngine:
     """Central coordinator for AIDEN project workflows.
@@ -72,16 +77,52 @@ class OrchestrationEngine:
             project_id=project_id,
         ))
 
-        # Start first phase
+        # Commit before detaching so the background run sees the new project status
         first_phase = next((p for p in project.phases if p.phase_type == "analysis"), None)
-        if first_phase:
-            await self.start_phase(project_id, str(first_phase.id))
+        await self.db.commit()
 
-        await self.db.flush()
+        # Start first phase in the background - agent runs can take minutes
+        if first_phase:
+            task = asyncio.create_task(self._safe_start_phase(project_id, str(first_phase.id)))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
         logger.info(f"Project started: {project_id}")
         return {"project_id": project_id, "status": "analysis", "phase": "analysis"}
 
+    async def _safe_start_phase(self, project_id: str, phase_id: str) -> None:
+        """Run start_phase detached from the request, on its own DB session.
+
+        The request-scoped session is closed once the API call returns, so the
+        background run gets a fresh session and engine. Failures are logged and
+        reported via AGENT_ERROR instead of propagating out of the task.
+        """
+        from app.db.session import async_session_factory
+
+        async with async_session_factory() as session:
+            engine = OrchestrationEngine(
+                session, self.llm_provider, self.rag_pipeline, self.event_bus
+            )
+            try:
+                await engine.start_phase(project_id, phase_id)
+            except AgentExecutionError as e:
+                # start_phase already marked the execution failed and published AGENT_ERROR
+                logger.error(f"Background phase run failed: {e.message}")
+            except Exception as e:
+                await session.rollback()
+                logger.exception(f"Background phase run crashed: phase_id={phase_id}")
+                try:
+                    await self.event_bus.publish_event(Event(
+                        event_type=EventTypes.AGENT_ERROR,
+                        project_id=project_id,
+                        data={"phase_id": phase_id, "error": str(e)},
+                    ))
+                except Exception as publish_error:
+                    logger.warning(f"Failed to publish agent error: {publish_error}")
+                return
+
+            await session.commit()
+
     async def start_phase(self, project_id: str, phase_id: str) -> dict:
         """Dispatch the appropriate agent for a phase."""
         phase = await self._get_phase(phase_id)
@@ -90,8 +131,9 @@ class OrchestrationEngine:
             raise ValueError(f"Phase '{phase.phase_type}' has no agent assigned yet")
 
         # Update phase status
-        phase.status = "in_progress"
-        phase.started_at = datetime.now(timezone.utc)
+        await self._update_phase(
+            phase.id, status="in_progress", started_at=datetime.now(timezone.utc)
+        )
 
         # Create agent execution record
         thread_id = f"aiden_{project_id}_{phase.phase_type}_{uuid.uuid4().hex[:8]}"
@@ -128,8 +170,7 @@ class OrchestrationEngine:
             input_data = await self._prepare_phase_input(project_id, phase, str(execution.id))
 
             # Execute agent
-            execution.status = "running"
-            await self.db.flush()
+            await self._update_execution(execution.id, status="running")
 
             result = await agent.execute(
                 input_data=input_data,
@@ -140,10 +181,8 @@ class OrchestrationEngine:
             await self._handle_agent_completion(execution, phase, result)
 
         except Exception as e:
-            execution.status = "failed"
-            execution.error_message = str(e)
-            phase.status = "failed"
-            await self.db.flush()
+            await self._update_execution(execution.id, status="failed", error_message=str(e))
+            await self._update_phase(phase.id, status="failed")
 
             await self.event_bus.publish_event(Event(
                 event_type=EventTypes.AGENT_ERROR,
@@ -168,7 +207,7 @@ class OrchestrationEngine:
         decision: str,
         feedback: str | None = None,
         edits: dict | None = None,
-        decided_by: str | None = None,
+        decided_by: uuid.UUID | None = None,
     ) -> dict:
         """Handle a HITL review response and resume the agent."""
         from app.models.hitl import HITLReview
@@ -211,8 +250,7 @@ class OrchestrationEngine:
         )
         await agent.compile()
 
-        execution.status = "running"
-        await self.db.flush()
+        await self._update_execution(execution.id, status="running")
 
         result = await agent.resume(
             thread_id=execution.thread_id,
@@ -236,18 +274,19 @@ class OrchestrationEngine:
     ) -> None:
         """Handle agent execution completion - persist deliverables and transition."""
         phase_status = result.get("phase_status", "completed")
+        # Events are buffered and sent in one Redis pipeline
+        pending_events: list[Event] = []
 
         if phase_status == "completed":
-            execution.status = "completed"
-            execution.completed_at = datetime.now(timezone.utc)
-            phase.status = "completed"
-            phase.completed_at = datetime.now(timezone.utc)
+            now = datetime.now(timezone.utc)
+            await self._update_execution(execution.id, status="completed", completed_at=now)
+            await self._update_phase(phase.id, status="completed", completed_at=now)
 
             # Persist deliverables
             await self._persist_deliverables(phase, result)
 
-            # Publish completion event
-            await self.event_bus.publish_event(Event(
+            # Queue completion event
+            pending_events.append(Event(
                 event_type=EventTypes.PHASE_COMPLETED,
                 project_id=str(phase.project_id),
                 execution_id=str(execution.id),
@@ -261,25 +300,33 @@ class OrchestrationEngine:
                 # Auto-transition to next phase
                 next_phase = await self._get_phase_by_type(str(phase.project_id), next_phase_type)
                 if next_phase:
+                    # Subscribers must see this phase complete before the next one starts
+                    await self.event_bus.publish_many(pending_events)
+                    # start_phase flushes internally, covering any remaining changes
                     await self.start_phase(str(phase.project_id), str(next_phase.id))
+                    return
             elif not next_phase_type:
                 # All phases complete
-                project = await self._get_project(str(phase.project_id))
-                project.status = "completed"
+                await self.db.execute(
+                    update(Project).where(Project.id == phase.project_id).values(status="completed")
+                )
 
-                await self.event_bus.publish_event(Event(
+                pending_events.append(Event(
                     event_type=EventTypes.PROJECT_COMPLETED,
                     project_id=str(phase.project_id),
                 ))
 
+        await self.event_bus.publish_many(pending_events)
         await self.db.flush()
 
     async def _persist_deliverables(self, phase: ProjectPhase, result: dict) -> None:
         """Persist deliverables from agent output to the database."""
+        deliverables: list[dict] = []
+
         # Requirements Specification
         if result.get("requirements_spec"):
             spec = result["requirements_spec"]
-            await self.deliverable_service.create_deliverable(
+            deliverables.append(dict(
                 phase_id=phase.id,
                 title=spec.get("title", "Requirements Specification"),
                 deliverable_type="requirements_spec",
@@ -287,21 +334,37 @@ class OrchestrationEngine:
                 content_structured=spec,
                 format="markdown",
                 created_by=f"agent:{phase.agent_name}",
-            )
+            ))
 
-        # Traceability Matrix
+        # Traceability Matrix - stored once as structured JSON; the text form
+        # is rendered on read (see DeliverableVersionResponse)
         if result.get("traceability_matrix"):
             matrix = result["traceability_matrix"]
-            import json
-            await self.deliverable_service.create_deliverable(
+            deliverables.append(dict(
                 phase_id=phase.id,
                 title=matrix.get("title", "Requirements Traceability Matrix"),
                 deliverable_type="traceability_matrix",
-                content=json.dumps(matrix, ensure_ascii=False, indent=2),
+                content="",
                 content_structured=matrix,
                 format="json",
                 created_by=f"agent:{phase.agent_name}",
-            )
+            ))
+
+        # One multi-row INSERT per table instead of two flushes per deliverable
+        await self.deliverable_service.create_deliverables(deliverables)
+
+    # Status transitions are plain column writes; issuing the UPDATE directly skips
+    # unit-of-work change tracking. Loaded instances are kept in sync by the session.
+
+    async def _update_phase(self, phase_id: uuid.UUID, **values) -> None:
+        await self.db.execute(
+            update(ProjectPhase).where(ProjectPhase.id == phase_id).values(**values)
+        )
+
+    async def _update_execution(self, execution_id: uuid.UUID, **values) -> None:
+        await self.db.execute(
+            update(AgentExecution).where(AgentExecution.id == execution_id).values(**values)
+        )
 
     async def _prepare_phase_input(
         self, project_id: str, phase: ProjectPhase, execution_id: str
@@ -364,7 +427,13 @@ class OrchestrationEngine:
         return project
 
     async def _get_phase(self, phase_id: str) -> ProjectPhase:
-        stmt = select(ProjectPhase).where(ProjectPhase.id == uuid.UUID(phase_id))
+        # Callers only touch scalar columns; raiseload("*") skips the model's
+        # selectin loads of tasks/deliverables/executions/project
+        stmt = (
+            select(ProjectPhase)
+            .options(raiseload("*"))
+            .where(ProjectPhase.id == uuid.UUID(phase_id))
+        )
         result = await self.db.execute(stmt)
         phase = result.scalar_one_or_none()
         if not phase:
@@ -372,9 +441,13 @@ class OrchestrationEngine:
         return phase
 
     async def _get_phase_by_type(self, project_id: str, phase_type: str) -> ProjectPhase | None:
-        stmt = select(ProjectPhase).where(
-            ProjectPhase.project_id == uuid.UUID(project_id),
-            ProjectPhase.phase_type == phase_type,
+        stmt = (
+            select(ProjectPhase)
+            .options(raiseload("*"))
+            .where(
+                ProjectPhase.project_id == uuid.UUID(project_id),
+                ProjectPhase.phase_type == phase_type,
+            )
         )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
@@ -1,11 +1,18 @@
-"""Redis PubSub event bus for real-time event distribution."""
+"""Redis PubSub event bus for real-time event distribution.
+
+Every event goes to its project's PubSub channel (low-latency per-project
+subscribers) and to a single capped Redis stream that admin monitors read
+with XREAD, which also retains recent history for replay.
+"""
 
 from __future__ import annotations
-import json
+import asyncio
 from typing import Any, AsyncGenerator, Callable
 
+import orjson
 import redis.asyncio as aioredis
 
+from app.config import settings
 from app.core.logging import get_logger
 from app.db.redis import get_redis
 from app.orchestration.events import Event
@@ -17,9 +24,16 @@ class EventBus:
     """Redis PubSub-based event bus for distributing agent and system events."""
 
     CHANNEL_PREFIX = "aiden:events"
+    STREAM_KEY = "aiden:events:stream"
+    # Bounded in-process buffer for publish_nowait and how many queued events
+    # the drain task sends per Redis round-trip
+    QUEUE_MAXSIZE = 1_000
+    DRAIN_BATCH_SIZE = 100
 
     def __init__(self, redis_client: aioredis.Redis | None = None):
         self._redis = redis_client
+        self._queue: asyncio.Queue[Event] | None = None
+        self._drain_task: asyncio.Task | None = None
 
     @property
     def redis(self) -> aioredis.Redis:
@@ -30,23 +44,37 @@ class EventBus:
     def _channel_for_project(self, project_id: str) -> str:
         return f"{self.CHANNEL_PREFIX}:{project_id}"
 
-    async def publish(self, event_type: str, data: dict, project_id: str | None = None) -> None:
-        """Publish an event to the project's channel."""
-        pid = project_id or data.get("project_id", "global")
-        channel = self._channel_for_project(pid)
+    def _encode(
+        self, event_type: str, data: dict, project_id: str | None = None
+    ) -> tuple[str, bytes, bytes]:
+        """Build the (channel, payload, stream payload) triple for an event.
 
+        The stream retains history, so an event over
+        ``event_stream_max_payload_bytes`` (typically ``agent.step`` with the
+        full agent state) is stored there without its ``state`` and marked
+        ``truncated``; PubSub subscribers still get the full payload.
+        """
+        pid = project_id or data.get("project_id", "global")
         message = {
             "event_type": event_type,
             "project_id": pid,
             "data": data,
         }
-
-        await self.redis.publish(channel, json.dumps(message, default=str))
-        logger.debug(f"Published {event_type} to {channel}")
-
-    async def publish_event(self, event: Event) -> None:
-        """Publish a structured Event object."""
-        await self.publish(
+        # orjson handles datetime/UUID natively; anything else falls back to str
+        payload = orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+        stream_payload = payload
+        if len(payload) > settings.event_stream_max_payload_bytes:
+            message["data"] = {k: v for k, v in data.items() if k != "state"}
+            message["truncated"] = True
+            stream_payload = orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+            if len(stream_payload) > settings.event_stream_max_payload_bytes:
+                del message["data"]
+                stream_payload = orjson.dumps(message)
+        return self._channel_for_project(pid), payload, stream_payload
+
+    def _encode_event(self, event: Event) -> tuple[str, bytes, bytes]:
+        """Build the (channel, payload, stream payload) triple for a structured Event."""
+        return self._encode(
             event_type=event.event_type,
             data={
                 "execution_id": event.execution_id,
@@ -57,6 +85,79 @@ class EventBus:
             project_id=event.project_id,
         )
 
+    async def _send(self, messages: list[tuple[str, bytes, bytes]]) -> None:
+        """Deliver encoded events to their channels and the stream in one round-trip."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for channel, payload, stream_payload in messages:
+                pipe.publish(channel, payload)
+                pipe.xadd(
+                    self.STREAM_KEY, {"d": stream_payload},
+                    maxlen=settings.event_stream_maxlen, approximate=True,
+                )
+            await pipe.execute()
+
+    async def publish(self, event_type: str, data: dict, project_id: str | None = None) -> None:
+        """Publish an event to the project's channel."""
+        encoded = self._encode(event_type, data, project_id)
+        await self._send([encoded])
+        logger.debug(f"Published {event_type} to {encoded[0]}")
+
+    async def publish_event(self, event: Event) -> None:
+        """Publish a structured Event object."""
+        encoded = self._encode_event(event)
+        await self._send([encoded])
+        logger.debug(f"Published {event.event_type} to {encoded[0]}")
+
+    async def publish_many(self, events: list[Event]) -> None:
+        """Publish several Events in a single Redis round-trip, preserving order."""
+        if not events:
+            return
+
+        await self._send([self._encode_event(event) for event in events])
+        logger.debug(f"Published {len(events)} events in one pipeline")
+
+    async def publish_nowait(self, event: Event) -> None:
+        """Queue an Event for background delivery instead of waiting on Redis.
+
+        Returns as soon as the event is buffered; a drain task publishes
+        queued events in batches, in order. When the buffer is full this
+        waits for room, which applies back-pressure to the producer.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Event queue full; waiting for the drain task")
+            await self._queue.put(event)
+
+    async def _drain(self) -> None:
+        """Deliver queued events until cancelled."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.DRAIN_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self.publish_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to publish {len(batch)} queued events: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def close(self) -> None:
+        """Flush events queued by publish_nowait and stop the drain task."""
+        if self._drain_task is None:
+            return
+        if not self._drain_task.done():
+            await self._queue.join()
+        self._drain_task.cancel()
+        self._drain_task = None
+
     async def subscribe(self, project_id: str) -> AsyncGenerator[dict, None]:
         """Subscribe to events for a specific project. Yields parsed event dicts."""
         channel = self._channel_for_project(project_id)
@@ -69,28 +170,26 @@ class EventBus:
             async for message in pubsub.listen():
                 if message["type"] == "message":
                     try:
-                        data = json.loads(message["data"])
+                        data = orjson.loads(message["data"])
                         yield data
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         logger.warning(f"Invalid JSON in event: {message['data']}")
         finally:
             await pubsub.unsubscribe(channel)
             await pubsub.close()
 
-    async def subscribe_all(self) -> AsyncGenerator[dict, None]:
-        """Subscribe to all AIDEN events (for admin monitoring)."""
-        pattern = f"{self.CHANNEL_PREFIX}:*"
-        pubsub = self.redis.pubsub()
-        await pubsub.psubscribe(pattern)
-
-        try:
-            async for message in pubsub.listen():
-                if message["type"] == "pmessage":
+    async def subscribe_all(self, last_id: str = "$") -> AsyncGenerator[dict, None]:
+        """Follow all AIDEN events from the fan-out stream (for admin monitoring).
+
+        ``last_id`` defaults to new events only; pass a stream entry ID (or "0")
+        to replay retained history first.
+        """
+        while True:
+            entries = await self.redis.xread({self.STREAM_KEY: last_id}, block=0, count=100)
+            for _stream, messages in entries:
+                for entry_id, fields in messages:
+                    last_id = entry_id
                     try:
-                        data = json.loads(message["data"])
-                        yield data
-                    except json.JSONDecodeError:
-                        pass
-        finally:
-            await pubsub.punsubscribe(pattern)
-            await pubsub.close()
+                        yield orjson.loads(fields["d"])
+                    except (KeyError, orjson.JSONDecodeError):
+                        logger.warning(f"Invalid event in stream: {entry_id}")
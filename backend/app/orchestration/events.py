@@ -3,6 +3,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 
@@ -38,12 +39,13 @@ class EventTypes:
     DELIVERABLE_APPROVED = "deliverable.approved"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """Structured event for the event bus."""
     event_type: str
     project_id: str
     data: dict = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    # Kept as a datetime; the event bus formats it only when the event is published
+    timestamp: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     execution_id: str | None = None
     agent_name: str | None = None
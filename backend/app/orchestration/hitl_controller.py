@@ -44,7 +44,7 @@ class HITLController:
         )
 
         # Publish HITL requested event
-        await self.event_bus.publish_event(Event(
+        await self.event_bus.publish_nowait(Event(
             event_type=EventTypes.HITL_REQUESTED,
             project_id=project_id,
             execution_id=execution_id,
@@ -68,7 +68,7 @@ class HITLController:
         decision: str,
         feedback: str | None = None,
         edits: dict | None = None,
-        decided_by: str | None = None,
+        decided_by: uuid.UUID | None = None,
         project_id: str | None = None,
     ) -> dict:
         """Resolve a HITL interrupt and prepare resume data for the agent.
@@ -86,7 +86,7 @@ class HITLController:
 
         # Publish resolution event
         if project_id:
-            await self.event_bus.publish_event(Event(
+            await self.event_bus.publish_nowait(Event(
                 event_type=EventTypes.HITL_RESOLVED,
                 project_id=project_id,
                 data={
@@ -100,7 +100,7 @@ class HITLController:
             "decision": decision,
             "feedback": feedback,
             "edits": edits,
-            "decided_by": decided_by,
+            "decided_by": str(decided_by) if decided_by else None,
             "resolved_at": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -1,7 +1,7 @@
 """Phase transition controller - manages the flow between development phases."""
 
 from __future__ import annotations
-from typing import List
+from typing import Dict, List
 
 from app.core.logging import get_logger
 
@@ -18,6 +18,14 @@ PHASE_AGENTS = {
     "testing": None,      # TBD
 }
 
+# Lookup tables derived once at import; phase transitions only do dict gets
+PHASE_INDEX: Dict[str, int] = {p: i for i, p in enumerate(PHASE_ORDER)}
+PHASE_NEXT: Dict[str, str | None] = {
+    p: (PHASE_ORDER[i + 1] if i + 1 < len(PHASE_ORDER) else None)
+    for p, i in PHASE_INDEX.items()
+}
+PHASE_READY: Dict[str, bool] = {p: a is not None for p, a in PHASE_AGENTS.items()}
+
 
 class PhaseController:
     """Controls phase transitions in a project workflow."""
@@ -25,14 +33,10 @@ class PhaseController:
     @staticmethod
     def get_next_phase(current_phase: str) -> str | None:
         """Get the next phase after the current one."""
-        try:
-            idx = PHASE_ORDER.index(current_phase)
-            if idx + 1 < len(PHASE_ORDER):
-                return PHASE_ORDER[idx + 1]
-            return None
-        except ValueError:
+        if current_phase not in PHASE_INDEX:
             logger.error(f"Unknown phase: {current_phase}")
             return None
+        return PHASE_NEXT[current_phase]
 
     @staticmethod
     def get_agent_for_phase(phase_type: str) -> str | None:
@@ -42,8 +46,7 @@ class PhaseController:
     @staticmethod
     def is_phase_ready(phase_type: str) -> bool:
         """Check if a phase has an agent assigned and is ready to execute."""
-        agent = PHASE_AGENTS.get(phase_type)
-        return agent is not None
+        return PHASE_READY.get(phase_type, False)
 
     @staticmethod
     def get_all_phases() -> List[dict]:
@@ -53,7 +56,7 @@ class PhaseController:
                 "phase_type": phase,
                 "phase_order": i + 1,
                 "agent_name": PHASE_AGENTS.get(phase),
-                "is_ready": PHASE_AGENTS.get(phase) is not None,
+                "is_ready": PHASE_READY[phase],
             }
             for i, phase in enumerate(PHASE_ORDER)
         ]
@@ -2,54 +2,118 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from app.config import settings
 
-@dataclass
+try:
+    import semantic_text_splitter
+except ImportError:  # Native splitter is optional; LangChain is the fallback
+    semantic_text_splitter = None
+
+
+@dataclass(slots=True)
 class Chunk:
-    """A text chunk with metadata."""
+    """A text chunk with metadata.
+
+    ``metadata`` is the document-level dict and is shared by every chunk of a
+    document; treat it as read-only. Use ``chunk_metadata()`` for the
+    per-chunk view that includes ``chunk_index``.
+    """
     content: str
     index: int
     metadata: dict = field(default_factory=dict)
 
+    def chunk_metadata(self) -> dict:
+        """Document metadata plus this chunk's position, built on demand."""
+        return {**self.metadata, "chunk_index": self.index}
+
+
+# Korean-aware separators: full-width sentence-final marks are tried before
+# ASCII punctuation, which is comparatively rare in Korean text
+KOREAN_SEPARATORS = ["\n\n", "\n", "。", "？", "！", ". ", "? ", "! ", " ", ""]
 
-# Korean-aware separators
-KOREAN_SEPARATORS = ["\n\n", "\n", ". ", ".\n", "。", " ", ""]
+# Code-aware separators: keep top-level definitions together
+CODE_SEPARATORS = ["\nclass ", "\ndef ", "\n\n", "\n", " ", ""]
 
 # Chunking strategies per document type
+# ("separators" drive the LangChain splitter; "markdown" selects the native Markdown splitter)
 CHUNK_STRATEGIES: Dict[str, dict] = {
     "dev_request": {
         "chunk_size": 1000,
         "chunk_overlap": 200,
         "separators": KOREAN_SEPARATORS,
+        "markdown": False,
     },
     "requirements_spec": {
         "chunk_size": 1500,
         "chunk_overlap": 300,
         "separators": ["\n## ", "\n### ", "\n\n", "\n", ". ", " ", ""],
+        "markdown": True,
     },
     "design_doc": {
         "chunk_size": 1200,
         "chunk_overlap": 250,
         "separators": ["\n## ", "\n### ", "\n\n", "\n", ". ", " ", ""],
+        "markdown": True,
+    },
+    "code": {
+        "chunk_size": 1500,
+        "chunk_overlap": 200,
+        "separators": CODE_SEPARATORS,
+        "markdown": False,
     },
     "default": {
         "chunk_size": 1000,
         "chunk_overlap": 200,
         "separators": KOREAN_SEPARATORS,
+        "markdown": False,
     },
 }
 
 
+def _build_native_splitter(strategy: dict) -> Any:
+    """Construct a semantic-text-splitter instance for a chunking strategy."""
+    splitter_cls = (
+        semantic_text_splitter.MarkdownSplitter
+        if strategy["markdown"]
+        else semantic_text_splitter.TextSplitter
+    )
+    return splitter_cls(strategy["chunk_size"], overlap=strategy["chunk_overlap"])
+
+
 class TextChunker:
-    """Splits text into chunks using configurable strategies."""
+    """Splits text into chunks using configurable strategies.
+
+    Uses the Rust-backed semantic-text-splitter when it is installed and
+    enabled via ``settings.use_native_chunker``; otherwise falls back to
+    LangChain's RecursiveCharacterTextSplitter.
+    """
 
-    def __init__(self, default_chunk_size: int = 1000, default_chunk_overlap: int = 200):
+    def __init__(
+        self,
+        default_chunk_size: int = 1000,
+        default_chunk_overlap: int = 200,
+        use_native: bool | None = None,
+    ):
         self.default_chunk_size = default_chunk_size
         self.default_chunk_overlap = default_chunk_overlap
 
+        if use_native is None:
+            use_native = settings.use_native_chunker
+        self.use_native = use_native and semantic_text_splitter is not None
+
+        # Splitters are built once per doc_type and reused across calls
+        self._native_splitters: Dict[str, Any] = {}
+        self._langchain_splitters: Dict[str, RecursiveCharacterTextSplitter] = {}
+        if self.use_native:
+            self._native_splitters = {
+                doc_type: _build_native_splitter(strategy)
+                for doc_type, strategy in CHUNK_STRATEGIES.items()
+            }
+
     def split(
         self,
         text: str,
@@ -57,24 +121,32 @@ class TextChunker:
         metadata: dict | None = None,
     ) -> List[Chunk]:
         """Split text into chunks based on document type strategy."""
-        strategy = CHUNK_STRATEGIES.get(doc_type, CHUNK_STRATEGIES["default"])
-
-        splitter = RecursiveCharacterTextSplitter(
-            chunk_size=strategy["chunk_size"],
-            chunk_overlap=strategy["chunk_overlap"],
-            separators=strategy["separators"],
-            length_function=len,
-            is_separator_regex=False,
-        )
-
-        documents = splitter.create_documents(
-            texts=[text],
-            metadatas=[metadata or {}],
-        )
-
-        chunks = []
-        for i, doc in enumerate(documents):
-            chunk_meta = {**(metadata or {}), "chunk_index": i}
-            chunks.append(Chunk(content=doc.page_content, index=i, metadata=chunk_meta))
-
-        return chunks
+        if self.use_native:
+            splitter = self._native_splitters.get(doc_type, self._native_splitters["default"])
+            texts = splitter.chunks(text)
+        else:
+            texts = self._split_with_langchain(text, doc_type)
+
+        # One metadata dict per document, not per chunk
+        base_meta = metadata or {}
+        return [Chunk(content=content, index=i, metadata=base_meta) for i, content in enumerate(texts)]
+
+    def _split_with_langchain(self, text: str, doc_type: str) -> List[str]:
+        """Fallback path using LangChain's RecursiveCharacterTextSplitter."""
+        if doc_type not in CHUNK_STRATEGIES:
+            doc_type = "default"
+
+        splitter = self._langchain_splitters.get(doc_type)
+        if splitter is None:
+            strategy = CHUNK_STRATEGIES[doc_type]
+            splitter = RecursiveCharacterTextSplitter(
+                chunk_size=strategy["chunk_size"],
+                chunk_overlap=strategy["chunk_overlap"],
+                separators=strategy["separators"],
+                length_function=len,
+                is_separator_regex=False,
+            )
+            self._langchain_splitters[doc_type] = splitter
+
+        # split_text skips wrapping each piece in a LangChain Document
+        return splitter.split_text(text)
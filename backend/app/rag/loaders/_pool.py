@@ -0,0 +1,43 @@
+"""Process pool shared by the document loaders.
+
+PDF and DOCX parsing is CPU-bound, so extraction runs in worker processes
+rather than the event loop's default thread executor where the GIL
+serializes concurrent ingests. Workers are spawned (not forked) so they do
+not inherit the server's event loop, sockets or threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+_LOADER_POOL: ProcessPoolExecutor | None = None
+
+
+def get_loader_pool() -> ProcessPoolExecutor:
+    """Return the shared loader pool, creating it on first use."""
+    global _LOADER_POOL
+    if _LOADER_POOL is None:
+        _LOADER_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _LOADER_POOL
+
+
+async def run_in_loader_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a picklable top-level function in the loader pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_loader_pool(), fn, *args)
+
+
+def shutdown_loader_pool() -> None:
+    """Stop the loader pool's workers (called on application shutdown)."""
+    global _LOADER_POOL
+    if _LOADER_POOL is not None:
+        _LOADER_POOL.shutdown(wait=False, cancel_futures=True)
+        _LOADER_POOL = None
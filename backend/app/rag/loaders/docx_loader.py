@@ -1,11 +1,94 @@
 """DOCX document loader."""
 
-import asyncio
-
 from docx import Document as DocxDocument
+from docx.oxml.ns import qn
 
+from app.rag.loaders._pool import run_in_loader_pool
 from app.rag.loaders.base import BaseDocumentLoader, LoadedDocument
 
+# WordprocessingML tags, resolved once instead of per element
+_P, _TBL, _TR, _TC = qn("w:p"), qn("w:tbl"), qn("w:tr"), qn("w:tc")
+_R, _HYPERLINK = qn("w:r"), qn("w:hyperlink")
+_T, _TAB, _BR, _CR = qn("w:t"), qn("w:tab"), qn("w:br"), qn("w:cr")
+_NO_BREAK_HYPHEN, _PTAB = qn("w:noBreakHyphen"), qn("w:ptab")
+_BR_TYPE = qn("w:type")
+_PSTYLE_XPATH = "./w:pPr/w:pStyle/@w:val"
+
+
+def _paragraph_text(p) -> str:
+    """Join run text of a ``w:p`` element the same way python-docx does.
+
+    Only the paragraph's own runs (``w:r`` and ``w:hyperlink/w:r``) count;
+    text boxes, content controls and fields nested inside a run are skipped,
+    as are the duplicate Choice/Fallback copies of ``mc:AlternateContent``.
+    """
+    parts = []
+    for child in p.iterchildren(_R, _HYPERLINK):
+        runs = (child,) if child.tag == _R else child.iterchildren(_R)
+        for r in runs:
+            for el in r.iterchildren(_T, _TAB, _BR, _CR, _NO_BREAK_HYPHEN, _PTAB):
+                tag = el.tag
+                if tag == _T:
+                    parts.append(el.text or "")
+                elif tag == _TAB or tag == _PTAB:
+                    parts.append("\t")
+                elif tag == _BR:
+                    # Page and column breaks have no text equivalent
+                    if el.get(_BR_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag == _CR:
+                    parts.append("\n")
+                else:
+                    parts.append("-")
+    return "".join(parts)
+
+
+def extract_docx(file_path: str) -> LoadedDocument:
+    """Extract text from DOCX by walking the body XML directly."""
+    doc = DocxDocument(file_path)
+    body = doc.element.body
+    # pStyle holds the style id (e.g. "Heading1", or "1" in localized
+    # Word), so resolve ids to names once up front.
+    style_names = {s.style_id: s.name for s in doc.styles}
+    paragraphs = []
+    tables_text = []
+
+    for p in body.iterchildren(_P):
+        text = _paragraph_text(p)
+        if not text.strip():
+            continue
+        style_id = p.xpath(_PSTYLE_XPATH)
+        style_name = style_names.get(style_id[0], "") if style_id else ""
+        # Preserve heading structure
+        if style_name.startswith("Heading"):
+            level = style_name.replace("Heading ", "")
+            prefix = "#" * int(level) if level.isdigit() else "##"
+            paragraphs.append(f"{prefix} {text}")
+        else:
+            paragraphs.append(text)
+
+    # Extract table content
+    tables = list(body.iterchildren(_TBL))
+    for i, tbl in enumerate(tables):
+        rows = []
+        for tr in tbl.iterchildren(_TR):
+            cells = [
+                "\n".join(_paragraph_text(p) for p in tc.iterchildren(_P)).strip()
+                for tc in tr.iterchildren(_TC)
+            ]
+            rows.append(" | ".join(cells))
+        if rows:
+            tables_text.append(f"[Table {i + 1}]\n" + "\n".join(rows))
+
+    full_text = "\n\n".join(paragraphs)
+    if tables_text:
+        full_text += "\n\n" + "\n\n".join(tables_text)
+
+    return LoadedDocument(
+        text=full_text,
+        metadata={"paragraph_count": len(paragraphs), "table_count": len(tables)},
+    )
+
 
 class DocxLoader(BaseDocumentLoader):
     """Loads DOCX documents and extracts text content."""
@@ -19,38 +102,5 @@ class DocxLoader(BaseDocumentLoader):
         return mime_type in self.SUPPORTED_TYPES
 
     async def load(self, file_path: str) -> LoadedDocument:
-        """Extract text from DOCX."""
-        def _extract():
-            doc = DocxDocument(file_path)
-            paragraphs = []
-            tables_text = []
-
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    # Preserve heading structure
-                    if para.style and para.style.name.startswith("Heading"):
-                        level = para.style.name.replace("Heading ", "")
-                        prefix = "#" * int(level) if level.isdigit() else "##"
-                        paragraphs.append(f"{prefix} {para.text}")
-                    else:
-                        paragraphs.append(para.text)
-
-            # Extract table content
-            for i, table in enumerate(doc.tables):
-                rows = []
-                for row in table.rows:
-                    cells = [cell.text.strip() for cell in row.cells]
-                    rows.append(" | ".join(cells))
-                if rows:
-                    tables_text.append(f"[Table {i + 1}]\n" + "\n".join(rows))
-
-            full_text = "\n\n".join(paragraphs)
-            if tables_text:
-                full_text += "\n\n" + "\n\n".join(tables_text)
-
-            return LoadedDocument(
-                text=full_text,
-                metadata={"paragraph_count": len(paragraphs), "table_count": len(doc.tables)},
-            )
-
-        return await asyncio.to_thread(_extract)
+        """Extract text from DOCX in the shared loader process pool."""
+        return await run_in_loader_pool(extract_docx, file_path)
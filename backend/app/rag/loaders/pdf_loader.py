@@ -1,12 +1,28 @@
 """PDF document loader."""
 
-import asyncio
-
-from pypdf import PdfReader
+import pymupdf
 
+from app.rag.loaders._pool import run_in_loader_pool
 from app.rag.loaders.base import BaseDocumentLoader, LoadedDocument
 
 
+def extract_pdf(file_path: str) -> LoadedDocument:
+    """Extract text from PDF using PyMuPDF (native MuPDF parser)."""
+    with pymupdf.open(file_path) as doc:
+        pages = []
+        metadata = {"page_count": doc.page_count}
+
+        for i, page in enumerate(doc):
+            text = page.get_text()
+            if text.strip():
+                pages.append(f"[Page {i + 1}]\n{text}")
+
+    return LoadedDocument(
+        text="\n\n".join(pages),
+        metadata=metadata,
+    )
+
+
 class PDFLoader(BaseDocumentLoader):
     """Loads PDF documents and extracts text content."""
 
@@ -16,20 +32,5 @@ class PDFLoader(BaseDocumentLoader):
         return mime_type in self.SUPPORTED_TYPES
 
     async def load(self, file_path: str) -> LoadedDocument:
-        """Extract text from PDF using pypdf."""
-        def _extract():
-            reader = PdfReader(file_path)
-            pages = []
-            metadata = {"page_count": len(reader.pages)}
-
-            for i, page in enumerate(reader.pages):
-                text = page.extract_text() or ""
-                if text.strip():
-                    pages.append(f"[Page {i + 1}]\n{text}")
-
-            return LoadedDocument(
-                text="\n\n".join(pages),
-                metadata=metadata,
-            )
-
-        return await asyncio.to_thread(_extract)
+        """Extract text from PDF in the shared loader process pool."""
+        return await run_in_loader_pool(extract_pdf, file_path)
@@ -1,13 +1,14 @@
 """RAG pipeline orchestrator - manages document ingestion and retrieval."""
 
 from __future__ import annotations
+import asyncio
 from typing import Any, Dict, List
 
 from app.core.exceptions import DocumentProcessingError, RAGPipelineError
 from app.core.logging import get_logger
-from app.rag.chunker import TextChunker
+from app.rag.chunker import Chunk, TextChunker
 from app.rag.embedder import Embedder
-from app.rag.loaders.base import BaseDocumentLoader
+from app.rag.loaders.base import BaseDocumentLoader, LoadedDocument
 from app.rag.loaders.docx_loader import DocxLoader
 from app.rag.loaders.pdf_loader import PDFLoader
 from app.rag.retriever import Retriever
@@ -30,16 +31,21 @@ class RAGPipeline:
             PDFLoader(),
             DocxLoader(),
         ]
+        # MIME type -> loader, so dispatch is a dict lookup per ingest
+        self._loader_by_mime: Dict[str, BaseDocumentLoader] = {}
+        for loader in self._loaders:
+            for mime_type in getattr(loader, "SUPPORTED_TYPES", ()):
+                self._loader_by_mime.setdefault(mime_type, loader)
 
     def _get_loader(self, mime_type: str) -> BaseDocumentLoader:
         """Find a loader that supports the given MIME type."""
-        for loader in self._loaders:
-            if loader.supports_mime_type(mime_type):
-                return loader
-        raise DocumentProcessingError(
-            document_id="unknown",
-            message=f"No loader available for MIME type: {mime_type}",
-        )
+        loader = self._loader_by_mime.get(mime_type)
+        if loader is None:
+            raise DocumentProcessingError(
+                document_id="unknown",
+                message=f"No loader available for MIME type: {mime_type}",
+            )
+        return loader
 
     async def ingest_document(
         self,
@@ -63,18 +69,7 @@ class RAGPipeline:
             logger.info(f"Loaded document: {len(loaded.text)} chars")
 
             # 2. Chunk the text
-            metadata = {
-                "document_id": document_id,
-                "project_id": project_id,
-                "doc_type": doc_type,
-                **(extra_metadata or {}),
-                **loaded.metadata,
-            }
-            chunks = self.chunker.split(
-                text=loaded.text,
-                doc_type=doc_type,
-                metadata=metadata,
-            )
+            chunks = self._chunk_document(loaded, document_id, project_id, doc_type, extra_metadata)
             logger.info(f"Created {len(chunks)} chunks")
 
             # 3. Store in vector DB
@@ -100,6 +95,88 @@ class RAGPipeline:
                 message=f"Failed to ingest document {document_id}: {str(e)}",
             )
 
+    async def ingest_documents(
+        self,
+        project_id: str,
+        documents: List[Dict[str, Any]],
+    ) -> List[dict]:
+        """Ingest several documents of a project with a single embedding request.
+
+        Each item takes the ``ingest_document`` arguments: ``document_id``,
+        ``file_path``, ``mime_type`` and optionally ``doc_type`` and
+        ``extra_metadata``. Documents are loaded concurrently, all chunks are
+        embedded in one call and upserted to ChromaDB together.
+
+        Returns one summary per document, in input order.
+        """
+        logger.info(f"Starting batch ingestion of {len(documents)} documents for project {project_id}")
+
+        try:
+            # 1. Load all documents concurrently
+            loaders = [self._get_loader(item["mime_type"]) for item in documents]
+            loaded_docs = await asyncio.gather(*[
+                loader.load(item["file_path"]) for loader, item in zip(loaders, documents)
+            ])
+
+            # 2. Chunk each document
+            all_chunks: List[Chunk] = []
+            summaries = []
+            for item, loaded in zip(documents, loaded_docs):
+                chunks = self._chunk_document(
+                    loaded,
+                    item["document_id"],
+                    project_id,
+                    item.get("doc_type", "default"),
+                    item.get("extra_metadata"),
+                )
+                all_chunks.extend(chunks)
+                summaries.append({
+                    "document_id": item["document_id"],
+                    "chunk_count": len(chunks),
+                    "text_length": len(loaded.text),
+                    "content_text": loaded.text,
+                    "document_metadata": loaded.metadata,
+                })
+            logger.info(f"Created {len(all_chunks)} chunks across {len(documents)} documents")
+
+            # 3. Embed once, then store in vector DB
+            if all_chunks:
+                embeddings = await self.embedder.embed_texts([c.content for c in all_chunks])
+                chunk_ids = await self.vectorstore.add_embeddings(all_chunks, embeddings, project_id)
+                logger.info(f"Stored {len(chunk_ids)} vectors in ChromaDB")
+
+            return summaries
+
+        except DocumentProcessingError:
+            raise
+        except Exception as e:
+            raise RAGPipelineError(
+                stage="ingest",
+                message=f"Failed to ingest {len(documents)} documents: {str(e)}",
+            )
+
+    def _chunk_document(
+        self,
+        loaded: LoadedDocument,
+        document_id: str,
+        project_id: str,
+        doc_type: str,
+        extra_metadata: dict | None,
+    ) -> List[Chunk]:
+        """Split a loaded document into chunks tagged with document metadata."""
+        metadata = {
+            "document_id": document_id,
+            "project_id": project_id,
+            "doc_type": doc_type,
+            **(extra_metadata or {}),
+            **loaded.metadata,
+        }
+        return self.chunker.split(
+            text=loaded.text,
+            doc_type=doc_type,
+            metadata=metadata,
+        )
+
     async def retrieve(
         self,
         query: str,
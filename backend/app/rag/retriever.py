@@ -1,6 +1,8 @@
 """Retrieval strategies for RAG pipeline."""
 
 from __future__ import annotations
+import asyncio
+from itertools import takewhile
 from typing import Any, Dict, List
 
 from app.core.logging import get_logger
@@ -31,8 +33,9 @@ class Retriever:
             filters=filters,
         )
 
-        # Filter by minimum relevance score
-        filtered = [r for r in results if r.get("relevance_score", 0) >= min_relevance]
+        # Results come back sorted by relevance, so stop at the first one
+        # below the threshold instead of scanning the tail
+        filtered = list(takewhile(lambda r: r.get("relevance_score", 0) >= min_relevance, results))
 
         logger.info(
             f"Retrieved {len(filtered)}/{len(results)} chunks for query "
@@ -64,20 +67,25 @@ class Retriever:
     ) -> List[Dict[str, Any]]:
         """Retrieve using multiple queries and merge results."""
         all_results: List[Dict[str, Any]] = []
-        seen_contents = set()
+        # str caches its own hash, so this keeps one int per result instead of
+        # a 100-char prefix copy. It also keys on the full content, so chunks
+        # sharing a long prefix are no longer collapsed.
+        seen: set[int] = set()
 
-        for query in queries:
-            results = await self.retrieve(
-                query=query,
-                project_id=project_id,
-                top_k=top_k_per_query,
-            )
+        # Searches are independent; gather keeps results in query order so
+        # dedup below stays deterministic.
+        results_per_query = await asyncio.gather(*(
+            self.retrieve(query=query, project_id=project_id, top_k=top_k_per_query)
+            for query in queries
+        ))
+
+        for results in results_per_query:
             for result in results:
-                content_key = result["content"][:100]
-                if not deduplicate or content_key not in seen_contents:
-                    seen_contents.add(content_key)
+                content_key = hash(result["content"])
+                if not deduplicate or content_key not in seen:
+                    seen.add(content_key)
                     all_results.append(result)
 
-        # Sort by relevance score
+        # Sort by relevance score (stable, so ties keep insertion order)
         all_results.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
         return all_results
@@ -1,10 +1,12 @@
 """ChromaDB vector store wrapper."""
 
 from __future__ import annotations
+import asyncio
+import functools
+import math
 from typing import Any, Dict, List
 
 import chromadb
-from langchain_chroma import Chroma
 
 from app.config import settings
 from app.core.logging import get_logger
@@ -14,12 +16,46 @@ from app.rag.embedder import Embedder
 logger = get_logger("rag.vectorstore")
 
 
+@functools.lru_cache(maxsize=1024)
+def _collection_name_for(project_id: str) -> str:
+    """Collection name for a project, memoized across retrieval calls."""
+    return f"project_{project_id.replace('-', '_')}"
+
+
+def _relevance_from_l2(distance: float) -> float:
+    """Map an L2 distance between unit vectors to a 0..1 relevance score.
+
+    Same normalisation LangChain applied for Chroma's default ``l2`` space,
+    so ``min_relevance`` thresholds keep their meaning.
+    """
+    return 1.0 - distance / math.sqrt(2)
+
+
 class ChromaVectorStore:
-    """Manages ChromaDB collections for per-project vector storage."""
+    """Manages ChromaDB collections for per-project vector storage.
+
+    Embeddings are always computed by ``Embedder`` and passed explicitly, so
+    collections are opened without a Chroma-side embedding function. The
+    server is reached through chromadb's native async client; the local
+    ``use_sqlite`` mode has no async client, so its calls go through a thread.
+    """
+
+    # add_chunks embeds and upserts in shards of this many chunks, with at
+    # most ADD_CONCURRENCY shards in flight
+    ADD_BATCH_SIZE = 64
+    ADD_CONCURRENCY = 8
 
     def __init__(self, embedder: Embedder):
         self.embedder = embedder
-        if settings.use_sqlite:
+        self._collections: Dict[str, Any] = {}
+        self._local = settings.use_sqlite
+        self._client = None
+        # Upsert batch limit reported by the server, fetched with the client
+        self._max_batch_size: int | None = None
+        # Serialises the lazy client/collection setup below, which concurrent
+        # add_chunks shards would otherwise race on during a cold start
+        self._init_lock = asyncio.Lock()
+        if self._local:
             # Use local persistent ChromaDB (no server needed)
             import os
             persist_dir = os.path.join(
@@ -28,45 +64,112 @@ class ChromaVectorStore:
             )
             os.makedirs(persist_dir, exist_ok=True)
             self._client = chromadb.PersistentClient(path=persist_dir)
+            self._max_batch_size = self._client.get_max_batch_size()
             logger.info(f"Using local persistent ChromaDB at {persist_dir}")
-        else:
-            self._client = chromadb.HttpClient(
-                host=settings.chroma_host,
-                port=settings.chroma_port,
-            )
+
+    async def _get_client(self):
+        """Return the Chroma client, connecting the async HTTP client on first use."""
+        if self._client is None:
+            async with self._init_lock:
+                if self._client is None:
+                    client = await chromadb.AsyncHttpClient(
+                        host=settings.chroma_host,
+                        port=settings.chroma_port,
+                    )
+                    self._max_batch_size = await client.get_max_batch_size()
+                    self._client = client
+        return self._client
+
+    async def _call(self, method, *args, **kwargs):
+        """Invoke a client/collection method on whichever client is configured."""
+        if self._local:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return await method(*args, **kwargs)
 
     def _get_collection_name(self, project_id: str) -> str:
         """Generate a collection name for a project."""
-        return f"project_{project_id.replace('-', '_')}"
-
-    def _get_langchain_store(self, project_id: str) -> Chroma:
-        """Get a LangChain Chroma instance for a project."""
-        return Chroma(
-            client=self._client,
-            collection_name=self._get_collection_name(project_id),
-            embedding_function=self.embedder.embeddings,
-        )
+        return _collection_name_for(project_id)
+
+    async def _get_collection(self, project_id: str):
+        """Get the (cached) collection handle for a project."""
+        collection = self._collections.get(project_id)
+        if collection is None:
+            client = await self._get_client()
+            async with self._init_lock:
+                collection = self._collections.get(project_id)
+                if collection is None:
+                    collection = await self._call(
+                        client.get_or_create_collection,
+                        self._get_collection_name(project_id),
+                        embedding_function=None,
+                    )
+                    self._collections[project_id] = collection
+        return collection
+
+    def _chunk_ids(self, chunks: List[Chunk], project_id: str) -> List[str]:
+        """Deterministic vector IDs so re-ingesting a document overwrites its chunks."""
+        # Batched ingests mix documents, so build each document's prefix once
+        prefixes: Dict[str, str] = {}
+        ids = []
+        for chunk in chunks:
+            document_id = chunk.metadata.get("document_id", "doc")
+            prefix = prefixes.get(document_id)
+            if prefix is None:
+                prefix = prefixes[document_id] = f"{project_id}_{document_id}_"
+            ids.append(prefix + str(chunk.index))
+        return ids
 
     async def add_chunks(
         self,
         chunks: List[Chunk],
         project_id: str,
     ) -> List[str]:
-        """Add document chunks to the project's vector store."""
-        store = self._get_langchain_store(project_id)
-
-        texts = [chunk.content for chunk in chunks]
-        metadatas = [chunk.metadata for chunk in chunks]
-        ids = [f"{project_id}_{chunk.metadata.get('document_id', 'doc')}_{chunk.index}" for chunk in chunks]
+        """Embed document chunks and add them to the project's vector store.
 
+        Large documents are split into shards that are embedded and upserted
+        concurrently, so embedding latency overlaps across shards.
+        """
         logger.info(f"Adding {len(chunks)} chunks to collection for project {project_id}")
 
-        result_ids = await store.aadd_texts(
-            texts=texts,
-            metadatas=metadatas,
-            ids=ids,
-        )
-        return result_ids
+        semaphore = asyncio.Semaphore(self.ADD_CONCURRENCY)
+
+        async def _add_shard(shard: List[Chunk]) -> List[str]:
+            async with semaphore:
+                embeddings = await self.embedder.embed_texts([chunk.content for chunk in shard])
+                return await self.add_embeddings(shard, embeddings, project_id)
+
+        shards = [
+            chunks[start:start + self.ADD_BATCH_SIZE]
+            for start in range(0, len(chunks), self.ADD_BATCH_SIZE)
+        ]
+        shard_ids = await asyncio.gather(*(_add_shard(shard) for shard in shards))
+        return [chunk_id for ids in shard_ids for chunk_id in ids]
+
+    async def add_embeddings(
+        self,
+        chunks: List[Chunk],
+        embeddings: List[List[float]],
+        project_id: str,
+    ) -> List[str]:
+        """Upsert chunks with precomputed embeddings into the project's collection."""
+        collection = await self._get_collection(project_id)
+        texts = [chunk.content for chunk in chunks]
+        metadatas = [chunk.chunk_metadata() for chunk in chunks]
+        ids = self._chunk_ids(chunks, project_id)
+
+        logger.info(f"Upserting {len(chunks)} embedded chunks for project {project_id}")
+
+        batch_size = self._max_batch_size
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            await self._call(
+                collection.upsert,
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=texts[start:end],
+                metadatas=metadatas[start:end],
+            )
+        return ids
 
     async def similarity_search(
         self,
@@ -75,29 +178,41 @@ class ChromaVectorStore:
         k: int = 10,
         filters: Dict[str, Any] | None = None,
     ) -> List[Dict[str, Any]]:
-        """Search for similar chunks in a project's collection."""
-        store = self._get_langchain_store(project_id)
-
-        results = await store.asimilarity_search_with_relevance_scores(
-            query=query,
-            k=k,
-            filter=filters,
+        """Search for similar chunks in a project's collection.
+
+        Results are ordered by descending relevance.
+        """
+        query_embedding = await self.embedder.embed_query(query)
+        collection = await self._get_collection(project_id)
+
+        results = await self._call(
+            collection.query,
+            query_embeddings=[query_embedding],
+            n_results=k,
+            where=filters,
+            include=["documents", "metadatas", "distances"],
         )
 
         return [
             {
-                "content": doc.page_content,
-                "metadata": doc.metadata,
-                "relevance_score": score,
+                "content": content,
+                "metadata": metadata or {},
+                "relevance_score": _relevance_from_l2(distance),
             }
-            for doc, score in results
+            for content, metadata, distance in zip(
+                results["documents"][0],
+                results["metadatas"][0],
+                results["distances"][0],
+            )
         ]
 
     async def delete_collection(self, project_id: str) -> None:
         """Delete a project's entire vector collection."""
         collection_name = self._get_collection_name(project_id)
+        self._collections.pop(project_id, None)
         try:
-            self._client.delete_collection(collection_name)
+            client = await self._get_client()
+            await self._call(client.delete_collection, collection_name)
             logger.info(f"Deleted collection: {collection_name}")
         except Exception as e:
             logger.warning(f"Failed to delete collection {collection_name}: {e}")
@@ -17,7 +17,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response envelope."""
     success: bool = True
     data: list[T]
-    meta: dict[str, int]
+    meta: dict[str, Any]
 
 
 class ErrorDetail(BaseModel):
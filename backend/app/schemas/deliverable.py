@@ -4,7 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 
 
 class DeliverableResponse(BaseModel):
@@ -34,6 +35,18 @@ class DeliverableVersionResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @model_validator(mode="after")
+    def _render_structured_content(self, info: ValidationInfo) -> DeliverableVersionResponse:
+        """JSON deliverables persist only content_structured; render the text view on demand.
+
+        Only applies when validated with ``context={"format": "json"}`` (the
+        parent deliverable's format); other formats keep their stored content.
+        """
+        fmt = (info.context or {}).get("format")
+        if fmt == "json" and not self.content and self.content_structured is not None:
+            self.content = orjson.dumps(self.content_structured, option=orjson.OPT_INDENT_2).decode()
+        return self
+
 
 class DeliverableExportRequest(BaseModel):
     format: str = Field(default="markdown", pattern="^(markdown|html|pdf|docx)$")
@@ -2,38 +2,49 @@
 
 from __future__ import annotations
 from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter
+
+from app.schemas.common import SuccessResponse
+
+Name = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+ProjectStatus = Literal[
+    "created", "analysis", "design", "development", "testing",
+    "paused", "completed", "failed", "archived",
+]
+PhaseType = Literal["analysis", "design", "development", "testing"]
+PhaseStatus = Literal["pending", "ready", "in_progress", "hitl_review", "completed", "failed"]
 
 
 # --- Project Schemas ---
 
 class ProjectCreate(BaseModel):
-    name: str = Field(..., min_length=1, max_length=500)
+    name: Name
     description: str | None = None
     config: dict = Field(default_factory=dict)
 
 
 class ProjectUpdate(BaseModel):
-    name: str | None = Field(None, min_length=1, max_length=500)
+    name: Name | None = None
     description: str | None = None
     config: dict | None = None
-    status: str | None = None
+    status: ProjectStatus | None = None
 
 
 class ProjectResponse(BaseModel):
     id: UUID
     name: str
     description: str | None
-    status: str
+    status: ProjectStatus
     owner_id: UUID | None
     config: dict
-    current_phase: str | None
+    current_phase: PhaseType | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "validate_assignment": False}
 
 
 class ProjectListResponse(ProjectResponse):
@@ -41,19 +52,14 @@ class ProjectListResponse(ProjectResponse):
     pass
 
 
-class ProjectDetailResponse(ProjectResponse):
-    """Detailed project response with related data."""
-    phases: list["PhaseResponse"] = []
-
-
 # --- Phase Schemas ---
 
 class PhaseResponse(BaseModel):
     id: UUID
     project_id: UUID
-    phase_type: str
+    phase_type: PhaseType
     phase_order: int
-    status: str
+    status: PhaseStatus
     agent_name: str | None
     started_at: datetime | None
     completed_at: datetime | None
@@ -61,17 +67,28 @@ class PhaseResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "validate_assignment": False}
+
+
+class ProjectDetailResponse(ProjectResponse):
+    """Detailed project response with related data."""
+    phases: list[PhaseResponse] = Field(default_factory=list)
 
 
 class PhaseStatusResponse(BaseModel):
     """Phase status with progress details."""
     id: UUID
-    phase_type: str
-    status: str
+    phase_type: PhaseType
+    status: PhaseStatus
     agent_name: str | None
     progress: dict = Field(default_factory=dict)
 
+    model_config = {"from_attributes": True, "frozen": True, "validate_assignment": False}
+
 
-# Rebuild forward refs
-ProjectDetailResponse.model_rebuild()
+# Built once at import so handlers reuse the compiled validators
+PROJECT_LIST_ADAPTER: TypeAdapter[list[ProjectListResponse]] = TypeAdapter(list[ProjectListResponse])
+PROJECT_DETAIL_ADAPTER: TypeAdapter[ProjectDetailResponse] = TypeAdapter(ProjectDetailResponse)
+PROJECT_DETAIL_ENVELOPE_ADAPTER: TypeAdapter[SuccessResponse[ProjectDetailResponse]] = TypeAdapter(
+    SuccessResponse[ProjectDetailResponse]
+)
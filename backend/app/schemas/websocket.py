@@ -8,13 +8,19 @@ from pydantic import BaseModel
 
 
 class WSMessage(BaseModel):
-    """Server-to-client WebSocket message."""
+    """Server-to-client WebSocket message.
+
+    Serialize with ``model_dump_json()`` so pydantic-core writes the JSON
+    (including the timestamp) directly, without building an intermediate dict.
+    """
     type: str
     event: str
     project_id: str
     timestamp: datetime
     data: Any = None
 
+    model_config = {"frozen": True, "ser_json_timedelta": "iso8601"}
+
 
 class WSClientMessage(BaseModel):
     """Client-to-server WebSocket message."""
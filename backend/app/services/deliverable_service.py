@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 import uuid
+from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.exceptions import NotFoundError
 from app.models.deliverable import Deliverable, DeliverableVersion
@@ -25,7 +27,10 @@ class DeliverableService:
         created_by: str = "system",
     ) -> Deliverable:
         """Create a new deliverable with its first version."""
+        # The id is assigned here so the version can reference it before the
+        # flush; both rows are written by a single flush.
         deliverable = Deliverable(
+            id=uuid.uuid4(),
             phase_id=phase_id,
             title=title,
             deliverable_type=deliverable_type,
@@ -34,7 +39,6 @@ class DeliverableService:
             format=format,
         )
         self.db.add(deliverable)
-        await self.db.flush()
 
         # Create first version
         version = DeliverableVersion(
@@ -49,6 +53,39 @@ class DeliverableService:
         await self.db.flush()
         return deliverable
 
+    async def create_deliverables(self, items: list[dict]) -> list[uuid.UUID]:
+        """Create several deliverables, each with its first version, in two bulk INSERTs.
+
+        Each item takes the same keyword arguments as ``create_deliverable``.
+        Returns the new deliverable IDs in input order.
+        """
+        deliverable_rows = []
+        version_rows = []
+        for item in items:
+            deliverable_id = uuid.uuid4()
+            deliverable_rows.append({
+                "id": deliverable_id,
+                "phase_id": item["phase_id"],
+                "title": item["title"],
+                "deliverable_type": item["deliverable_type"],
+                "status": "draft",
+                "current_version": 1,
+                "format": item.get("format", "markdown"),
+            })
+            version_rows.append({
+                "deliverable_id": deliverable_id,
+                "version_number": 1,
+                "content": item["content"],
+                "content_structured": item.get("content_structured"),
+                "change_summary": "Initial version",
+                "created_by": item.get("created_by", "system"),
+            })
+
+        if deliverable_rows:
+            await self.db.execute(insert(Deliverable), deliverable_rows)
+            await self.db.execute(insert(DeliverableVersion), version_rows)
+        return [row["id"] for row in deliverable_rows]
+
     async def get_deliverable(self, deliverable_id: uuid.UUID) -> Deliverable:
         """Get a deliverable by ID."""
         stmt = select(Deliverable).where(Deliverable.id == deliverable_id)
@@ -58,15 +95,14 @@ class DeliverableService:
             raise NotFoundError("Deliverable", str(deliverable_id))
         return deliverable
 
-    async def list_deliverables(self, phase_id: uuid.UUID) -> list[Deliverable]:
+    async def list_deliverables(self, phase_id: uuid.UUID) -> Sequence[Deliverable]:
         """List deliverables for a phase."""
         stmt = (
             select(Deliverable)
             .where(Deliverable.phase_id == phase_id)
             .order_by(Deliverable.created_at)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return (await self.db.scalars(stmt)).all()
 
     async def add_version(
         self,
@@ -77,11 +113,20 @@ class DeliverableService:
         created_by: str = "system",
     ) -> DeliverableVersion:
         """Add a new version to an existing deliverable."""
-        deliverable = await self.get_deliverable(deliverable_id)
-        new_version_number = deliverable.current_version + 1
+        # Bump the counter in the database and read it back in one statement;
+        # this also keeps concurrent add_version calls from sharing a number
+        stmt = (
+            update(Deliverable)
+            .where(Deliverable.id == deliverable_id)
+            .values(current_version=Deliverable.current_version + 1)
+            .returning(Deliverable.current_version)
+        )
+        new_version_number = (await self.db.execute(stmt)).scalar_one_or_none()
+        if new_version_number is None:
+            raise NotFoundError("Deliverable", str(deliverable_id))
 
         version = DeliverableVersion(
-            deliverable_id=deliverable.id,
+            deliverable_id=deliverable_id,
             version_number=new_version_number,
             content=content,
             content_structured=content_structured,
@@ -89,24 +134,32 @@ class DeliverableService:
             created_by=created_by,
         )
         self.db.add(version)
-
-        deliverable.current_version = new_version_number
         await self.db.flush()
         return version
 
-    async def get_versions(self, deliverable_id: uuid.UUID) -> list[DeliverableVersion]:
+    async def get_versions(self, deliverable_id: uuid.UUID) -> Sequence[DeliverableVersion]:
         """Get all versions of a deliverable."""
         stmt = (
             select(DeliverableVersion)
             .where(DeliverableVersion.deliverable_id == deliverable_id)
             .order_by(DeliverableVersion.version_number)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return (await self.db.scalars(stmt)).all()
 
     async def approve_deliverable(self, deliverable_id: uuid.UUID) -> Deliverable:
-        """Mark deliverable as approved/final."""
-        deliverable = await self.get_deliverable(deliverable_id)
-        deliverable.status = "approved"
-        await self.db.flush()
+        """Mark deliverable as approved/final.
+
+        Versions are not loaded; use ``get_versions`` if they are needed.
+        """
+        stmt = (
+            update(Deliverable)
+            .where(Deliverable.id == deliverable_id)
+            .values(status="approved")
+            .returning(Deliverable)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
+        deliverable = (await self.db.execute(stmt)).scalar_one_or_none()
+        if deliverable is None:
+            raise NotFoundError("Deliverable", str(deliverable_id))
         return deliverable
@@ -1,17 +1,79 @@
 """Document management service."""
 
 from __future__ import annotations
+import asyncio
+import mmap
 import os
 import uuid
+from collections.abc import Sequence
 from pathlib import Path
+from typing import BinaryIO
 
-from sqlalchemy import select
+from fastapi import UploadFile
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.exceptions import NotFoundError
 from app.models.document import Document
 
+# Block size when copying uploads to disk
+UPLOAD_BLOCK_SIZE = 1 << 20
+# Uploads larger than this are written through a memory map of the target
+MMAP_THRESHOLD = 32 * 1024 * 1024
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _copy_to_path(src: BinaryIO, dest: Path, size: int | None = None) -> int:
+    """Copy ``src`` into ``dest`` with raw os.write calls; returns bytes written."""
+    if size is not None and size > MMAP_THRESHOLD:
+        return _copy_to_mmap(src, dest, size)
+
+    written = 0
+    fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        while block := src.read(UPLOAD_BLOCK_SIZE):
+            # os.write may write less than asked; the view avoids re-slicing copies
+            view = memoryview(block)
+            while view:
+                view = view[os.write(fd, view):]
+            written += len(block)
+    finally:
+        os.close(fd)
+    return written
+
+
+def _copy_to_mmap(src: BinaryIO, dest: Path, size: int) -> int:
+    """Read ``src`` straight into a memory-mapped ``dest`` sized up front.
+
+    Saves the intermediate buffer copy of the write path. Dirty pages are
+    left for the kernel to write back, as with os.write (no msync).
+    """
+    readinto = getattr(src, "readinto", None)
+    written = 0
+    fd = os.open(dest, os.O_RDWR | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        os.ftruncate(fd, size)
+        with mmap.mmap(fd, size, access=mmap.ACCESS_WRITE) as mm, memoryview(mm) as view:
+            while written < size:
+                with view[written:written + UPLOAD_BLOCK_SIZE] as target:
+                    if readinto is not None:
+                        n = readinto(target)
+                    else:
+                        block = src.read(len(target))
+                        n = len(block)
+                        target[:n] = block
+                if not n:
+                    break
+                written += n
+        if written != size:
+            # Source was shorter than announced; drop the unwritten tail
+            os.ftruncate(fd, written)
+    finally:
+        os.close(fd)
+    return written
+
 
 class DocumentService:
     def __init__(self, db: AsyncSession):
@@ -23,18 +85,23 @@ class DocumentService:
         title: str,
         doc_type: str,
         file_name: str,
-        file_content: bytes,
+        file: UploadFile,
         mime_type: str,
-        uploaded_by: str | None = None,
+        uploaded_by: uuid.UUID | None = None,
     ) -> Document:
-        """Upload and store a document."""
+        """Upload and store a document.
+
+        The upload is copied to disk in ``UPLOAD_BLOCK_SIZE`` blocks in a
+        single worker thread, so memory use does not grow with the file size.
+        """
         # Ensure upload directory exists
         upload_dir = Path(settings.upload_dir) / str(project_id)
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(upload_dir.mkdir, parents=True, exist_ok=True)
 
         # Save file
         file_path = upload_dir / file_name
-        file_path.write_bytes(file_content)
+        await file.seek(0)
+        file_size = await asyncio.to_thread(_copy_to_path, file.file, file_path, file.size)
 
         document = Document(
             project_id=project_id,
@@ -42,10 +109,10 @@ class DocumentService:
             doc_type=doc_type,
             file_path=str(file_path),
             file_name=file_name,
-            file_size=len(file_content),
+            file_size=file_size,
             mime_type=mime_type,
             is_indexed=False,
-            uploaded_by=uuid.UUID(uploaded_by) if uploaded_by else None,
+            uploaded_by=uploaded_by,
         )
         self.db.add(document)
         await self.db.flush()
@@ -60,21 +127,28 @@ class DocumentService:
             raise NotFoundError("Document", str(document_id))
         return document
 
-    async def list_documents(self, project_id: uuid.UUID) -> list[Document]:
+    async def list_documents(self, project_id: uuid.UUID) -> Sequence[Document]:
         """List all documents for a project."""
         stmt = (
             select(Document)
             .where(Document.project_id == project_id)
             .order_by(Document.created_at.desc())
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return (await self.db.scalars(stmt)).all()
 
     async def mark_indexed(self, document_id: uuid.UUID, content_text: str | None = None) -> Document:
         """Mark a document as indexed after RAG processing."""
-        document = await self.get_document(document_id)
-        document.is_indexed = True
+        values = {"is_indexed": True}
         if content_text:
-            document.content_text = content_text
-        await self.db.flush()
+            values["content_text"] = content_text
+        stmt = (
+            update(Document)
+            .where(Document.id == document_id)
+            .values(**values)
+            .returning(Document)
+            .execution_options(populate_existing=True)
+        )
+        document = (await self.db.execute(stmt)).scalar_one_or_none()
+        if document is None:
+            raise NotFoundError("Document", str(document_id))
         return document
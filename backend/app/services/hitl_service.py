@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
 from app.models.hitl import HITLReview, ReviewDecision
 
+UTC = timezone.utc
+
 
 class HITLService:
     def __init__(self, db: AsyncSession):
@@ -45,71 +48,63 @@ class HITLService:
             raise NotFoundError("HITLReview", str(review_id))
         return review
 
-    async def list_pending_reviews(self) -> list[HITLReview]:
+    async def list_pending_reviews(self) -> Sequence[HITLReview]:
         """List all pending HITL reviews."""
         stmt = (
             select(HITLReview)
             .where(HITLReview.status.in_(["pending", "in_review"]))
             .order_by(HITLReview.created_at)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return (await self.db.scalars(stmt)).all()
 
-    async def approve_review(
-        self, review_id: uuid.UUID, feedback: str | None = None, decided_by: str | None = None
+    async def _decide(
+        self,
+        review_id: uuid.UUID,
+        decision: str,
+        feedback: str | None,
+        decided_by: uuid.UUID | None,
+        edits: dict | None = None,
     ) -> ReviewDecision:
-        """Approve a HITL review."""
-        review = await self.get_review(review_id)
-        review.status = "approved"
-        review.decided_at = datetime.now(timezone.utc)
+        """Set the review's outcome with a single UPDATE and record the decision."""
+        stmt = (
+            update(HITLReview)
+            .where(HITLReview.id == review_id)
+            .values(status=decision, decided_at=datetime.now(UTC))
+            .returning(HITLReview.id)
+        )
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
+            raise NotFoundError("HITLReview", str(review_id))
 
-        decision = ReviewDecision(
-            review_id=review.id,
-            decision="approved",
+        review_decision = ReviewDecision(
+            review_id=review_id,
+            decision=decision,
             feedback=feedback,
-            decided_by=uuid.UUID(decided_by) if decided_by else None,
+            edits=edits,
+            decided_by=decided_by,
         )
-        self.db.add(decision)
+        self.db.add(review_decision)
         await self.db.flush()
-        return decision
+        return review_decision
+
+    async def approve_review(
+        self, review_id: uuid.UUID, feedback: str | None = None, decided_by: uuid.UUID | None = None
+    ) -> ReviewDecision:
+        """Approve a HITL review."""
+        return await self._decide(review_id, "approved", feedback, decided_by)
 
     async def reject_review(
-        self, review_id: uuid.UUID, feedback: str, decided_by: str | None = None
+        self, review_id: uuid.UUID, feedback: str, decided_by: uuid.UUID | None = None
     ) -> ReviewDecision:
         """Reject a HITL review."""
-        review = await self.get_review(review_id)
-        review.status = "rejected"
-        review.decided_at = datetime.now(timezone.utc)
-
-        decision = ReviewDecision(
-            review_id=review.id,
-            decision="rejected",
-            feedback=feedback,
-            decided_by=uuid.UUID(decided_by) if decided_by else None,
-        )
-        self.db.add(decision)
-        await self.db.flush()
-        return decision
+        return await self._decide(review_id, "rejected", feedback, decided_by)
 
     async def request_revision(
         self,
         review_id: uuid.UUID,
         feedback: str,
         edits: dict | None = None,
-        decided_by: str | None = None,
+        decided_by: uuid.UUID | None = None,
     ) -> ReviewDecision:
         """Request revision for a HITL review."""
-        review = await self.get_review(review_id)
-        review.status = "revision_requested"
-        review.decided_at = datetime.now(timezone.utc)
+        return await self._decide(review_id, "revision_requested", feedback, decided_by, edits)
 
-        decision = ReviewDecision(
-            review_id=review.id,
-            decision="revision_requested",
-            feedback=feedback,
-            edits=edits,
-            decided_by=uuid.UUID(decided_by) if decided_by else None,
-        )
-        self.db.add(decision)
-        await self.db.flush()
-        return decision
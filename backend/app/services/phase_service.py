@@ -1,14 +1,18 @@
 """Phase management service."""
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.exceptions import NotFoundError
 from app.models.project import ProjectPhase
 
+UTC = timezone.utc
+
 
 class PhaseService:
     def __init__(self, db: AsyncSession):
@@ -23,45 +27,63 @@ class PhaseService:
             raise NotFoundError("Phase", str(phase_id))
         return phase
 
-    async def get_phases_for_project(self, project_id: uuid.UUID) -> list[ProjectPhase]:
+    async def get_phases_for_project(self, project_id: uuid.UUID) -> Sequence[ProjectPhase]:
         """Get all phases for a project ordered by phase_order."""
         stmt = (
             select(ProjectPhase)
             .where(ProjectPhase.project_id == project_id)
             .order_by(ProjectPhase.phase_order)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return (await self.db.scalars(stmt)).all()
+
+    async def _update_phase(self, phase_id: uuid.UUID, *criteria, **values) -> ProjectPhase | None:
+        """UPDATE ... RETURNING a phase in one round-trip; None if no row matched.
+
+        The selectin relationships (tasks, deliverables, executions) are not
+        loaded, as they would cost a SELECT each; use ``get_phase`` for them.
+        """
+        stmt = (
+            update(ProjectPhase)
+            .where(ProjectPhase.id == phase_id, *criteria)
+            .values(**values)
+            .returning(ProjectPhase)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def _transition(self, phase_id: uuid.UUID, **values) -> ProjectPhase:
+        """Apply an unguarded status change, raising NotFoundError for a bad ID."""
+        phase = await self._update_phase(phase_id, **values)
+        if phase is None:
+            raise NotFoundError("Phase", str(phase_id))
+        return phase
 
     async def start_phase(self, phase_id: uuid.UUID) -> ProjectPhase:
         """Start a phase execution."""
-        phase = await self.get_phase(phase_id)
-        if phase.status not in ("pending", "ready"):
+        # The status guard is part of the UPDATE, so two concurrent starts
+        # cannot both succeed
+        phase = await self._update_phase(
+            phase_id,
+            ProjectPhase.status.in_(("pending", "ready")),
+            status="in_progress",
+            started_at=datetime.now(UTC),
+        )
+        if phase is None:
+            phase = await self.get_phase(phase_id)
             raise ValueError(f"Cannot start phase in status: {phase.status}")
-
-        phase.status = "in_progress"
-        phase.started_at = datetime.now(timezone.utc)
-        await self.db.flush()
         return phase
 
     async def complete_phase(self, phase_id: uuid.UUID) -> ProjectPhase:
         """Mark a phase as completed."""
-        phase = await self.get_phase(phase_id)
-        phase.status = "completed"
-        phase.completed_at = datetime.now(timezone.utc)
-        await self.db.flush()
-        return phase
+        return await self._transition(
+            phase_id, status="completed", completed_at=datetime.now(UTC)
+        )
 
     async def fail_phase(self, phase_id: uuid.UUID) -> ProjectPhase:
         """Mark a phase as failed."""
-        phase = await self.get_phase(phase_id)
-        phase.status = "failed"
-        await self.db.flush()
-        return phase
+        return await self._transition(phase_id, status="failed")
 
     async def set_hitl_review(self, phase_id: uuid.UUID) -> ProjectPhase:
         """Set phase to HITL review status."""
-        phase = await self.get_phase(phase_id)
-        phase.status = "hitl_review"
-        await self.db.flush()
-        return phase
+        return await self._transition(phase_id, status="hitl_review")
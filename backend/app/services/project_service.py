@@ -4,14 +4,16 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.exceptions import NotFoundError
 from app.models.project import Project, ProjectPhase
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
+UTC = timezone.utc
+
 # Default phase configuration
 DEFAULT_PHASES = [
     {"phase_type": "analysis", "phase_order": 1, "agent_name": "ryan"},
@@ -25,30 +27,27 @@ class ProjectService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create_project(self, data: ProjectCreate, owner_id: str | None = None) -> Project:
+    async def create_project(self, data: ProjectCreate, owner_id: uuid.UUID | None = None) -> Project:
         """Create a new project with default phases."""
         project = Project(
             name=data.name,
             description=data.description,
             config=data.config,
-            owner_id=uuid.UUID(owner_id) if owner_id else None,
+            owner_id=owner_id,
             status="created",
         )
         self.db.add(project)
         await self.db.flush()
 
-        # Create default phases
-        for phase_def in DEFAULT_PHASES:
-            phase = ProjectPhase(
-                project_id=project.id,
-                phase_type=phase_def["phase_type"],
-                phase_order=phase_def["phase_order"],
-                agent_name=phase_def["agent_name"],
-                status="pending",
-            )
-            self.db.add(phase)
-
-        await self.db.flush()
+        # The default phases are a fixed payload; write them with one Core
+        # multi-row INSERT rather than through the unit of work
+        await self.db.execute(
+            insert(ProjectPhase.__table__),
+            [
+                {"id": uuid.uuid4(), "project_id": project.id, "status": "pending", **phase_def}
+                for phase_def in DEFAULT_PHASES
+            ],
+        )
         return project
 
     async def get_project(self, project_id: uuid.UUID) -> Project:
@@ -64,23 +63,35 @@ class ProjectService:
             raise NotFoundError("Project", str(project_id))
         return project
 
-    async def list_projects(self, offset: int = 0, limit: int = 20) -> tuple[list[Project], int]:
-        """List projects with pagination."""
-        # Count
-        count_stmt = select(Project)
-        count_result = await self.db.execute(count_stmt)
-        total = len(count_result.scalars().all())
-
-        # Fetch
+    async def list_projects(
+        self,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+        limit: int = 20,
+    ) -> tuple[list[Project], int]:
+        """List projects newest first using keyset pagination.
+
+        ``cursor`` is the ``(created_at, id)`` of the last project on the
+        previous page; the next page starts strictly after it, so the database
+        seeks on ``ix_projects_created_at_id`` instead of skipping rows.
+
+        The total comes back with the page as a scalar subquery, so both are
+        read in one round-trip. Only an empty page needs a separate COUNT.
+        """
+        total_col = select(func.count()).select_from(Project).scalar_subquery()
         stmt = (
-            select(Project)
-            .order_by(Project.created_at.desc())
-            .offset(offset)
+            select(Project, total_col.label("total"))
+            .order_by(Project.created_at.desc(), Project.id.desc())
             .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        projects = list(result.scalars().all())
-        return projects, total
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Project.created_at, Project.id) < cursor)
+        rows = (await self.db.execute(stmt)).all()
+        if rows:
+            return [row.Project for row in rows], rows[0].total
+
+        count_stmt = select(func.count()).select_from(Project)
+        total = (await self.db.execute(count_stmt)).scalar_one()
+        return [], total
 
     async def update_project(self, project_id: uuid.UUID, data: ProjectUpdate) -> Project:
         """Update a project."""
@@ -88,7 +99,7 @@ class ProjectService:
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(project, field, value)
-        project.updated_at = datetime.now(timezone.utc)
+        project.updated_at = datetime.now(UTC)
         await self.db.flush()
         return project
 
@@ -96,24 +107,31 @@ class ProjectService:
         """Soft delete a project by setting status to 'archived'."""
         project = await self.get_project(project_id)
         project.status = "archived"
-        project.updated_at = datetime.now(timezone.utc)
+        project.updated_at = datetime.now(UTC)
         await self.db.flush()
 
     async def start_project(self, project_id: uuid.UUID) -> Project:
-        """Start a project workflow - transitions to analysis phase."""
-        project = await self.get_project(project_id)
+        """Start a project workflow - transitions to analysis phase.
+
+        Phases are not loaded; use ``get_project`` if they are needed.
+        """
+        stmt = select(Project).options(lazyload("*")).where(Project.id == project_id)
+        project = (await self.db.execute(stmt)).scalar_one_or_none()
+        if not project:
+            raise NotFoundError("Project", str(project_id))
         if project.status not in ("created", "paused"):
             raise ValueError(f"Cannot start project in status: {project.status}")
 
         project.status = "analysis"
         project.current_phase = "analysis"
-        project.updated_at = datetime.now(timezone.utc)
+        project.updated_at = datetime.now(UTC)
 
         # Update first phase status
-        for phase in project.phases:
-            if phase.phase_type == "analysis":
-                phase.status = "ready"
-                break
+        await self.db.execute(
+            update(ProjectPhase)
+            .where(ProjectPhase.project_id == project_id, ProjectPhase.phase_type == "analysis")
+            .values(status="ready")
+        )
 
         await self.db.flush()
         return project
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -24,54 +25,89 @@ from app.schemas.project import ProjectCreate
 from app.services.project_service import ProjectService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def db_engine():
-    """Create an in-memory SQLite engine for test isolation."""
+    """Create an in-memory SQLite engine shared by the whole test session.
+
+    The schema is created once; tests are isolated by ``db_session`` rolling
+    back an outer transaction instead of re-running DDL.
+    """
     engine = create_async_engine(
         "sqlite+aiosqlite://",
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
         echo=False,
     )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the sqlite3 driver
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
 @pytest.fixture
 async def db_session(db_engine):
-    """Provide an async session bound to the test engine."""
-    session_factory = async_sessionmaker(
-        db_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with session_factory() as session:
-        yield session
-        await session.rollback()
-
-
-@pytest.fixture
-async def client(db_session):
-    """Async HTTP client wired to the FastAPI app with overridden deps."""
+    """Provide an async session inside a transaction that is rolled back after the test.
+
+    Commits made by the code under test only release a SAVEPOINT, so nothing
+    outlives the outer transaction.
+    """
+    async with db_engine.connect() as conn:
+        await conn.begin()
+        session_factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with session_factory() as session:
+            yield session
+        await conn.rollback()
+
+
+@pytest.fixture(scope="session")
+def _app():
+    """The FastAPI app with mock singletons installed once for the session."""
     from app.main import app
 
-    async def _override_get_db():
-        yield db_session
-
-    app.dependency_overrides[get_db] = _override_get_db
-
     # Inject mock singletons so endpoints that need them don't crash
     app.state.llm_provider = MagicMock()
     app.state.rag_pipeline = MagicMock()
     app.state.event_bus = MagicMock()
+    return app
+
 
-    transport = ASGITransport(app=app, raise_app_exceptions=False)
+@pytest.fixture(scope="session")
+async def _http_client(_app):
+    """Async HTTP client on the ASGI app, shared by the whole session."""
+    transport = ASGITransport(app=_app, raise_app_exceptions=False)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+async def client(_app, _http_client, db_session):
+    """Shared async HTTP client with ``get_db`` overridden for this test."""
+
+    async def _override_get_db():
+        yield db_session
+
+    _app.dependency_overrides[get_db] = _override_get_db
+    for name in ("llm_provider", "rag_pipeline", "event_bus"):
+        getattr(_app.state, name).reset_mock()
+
+    yield _http_client
+
+    _app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -78,3 +78,52 @@ async def test_get_nonexistent_project_api(client):
     resp = await client.get(f"{API}/{fake_id}")
     # NotFoundError is raised but no global exception handler → 500
     assert resp.status_code in (404, 500)
+
+
+async def test_list_projects_cursor_api(client):
+    """Following meta.next_cursor should return each project exactly once."""
+    for i in range(3):
+        await client.post(API, json={"name": f"Page-{i}"})
+
+    names = []
+    params = {"page_size": 2}
+    for _ in range(3):
+        body = (await client.get(API, params=params)).json()
+        names.extend(p["name"] for p in body["data"])
+        if not body["meta"]["next_cursor"]:
+            break
+        params["cursor"] = body["meta"]["next_cursor"]
+
+    assert sorted(names) == ["Page-0", "Page-1", "Page-2"]
+
+
+async def test_list_projects_invalid_cursor_api(client):
+    """GET /projects with a malformed cursor should be rejected."""
+    resp = await client.get(API, params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 422
+
+
+async def test_get_project_etag_api(client):
+    """GET /projects/{id} should honour If-None-Match until the project changes."""
+    create_resp = await client.post(API, json={"name": "Cached"})
+    project_id = create_resp.json()["data"]["id"]
+
+    first = await client.get(f"{API}/{project_id}")
+    etag = first.headers["etag"]
+    assert first.json()["data"]["name"] == "Cached"
+
+    not_modified = await client.get(f"{API}/{project_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    # Weak comparison: W/ prefixes are ignored and * matches any current representation
+    for header in (f'"other", W/{etag}', "*"):
+        resp = await client.get(f"{API}/{project_id}", headers={"If-None-Match": header})
+        assert resp.status_code == 304
+
+    # A phase transition leaves the project row alone but must still change the ETag
+    phase_id = first.json()["data"]["phases"][0]["id"]
+    await client.post(f"/api/v1/phases/{phase_id}/start")
+    changed = await client.get(f"{API}/{project_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["data"]["phases"][0]["status"] == "in_progress"
@@ -0,0 +1,48 @@
+"""Unit tests for TextChunker."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.rag.chunker import CHUNK_STRATEGIES, TextChunker, semantic_text_splitter
+
+BACKENDS = [
+    pytest.param(True, id="native", marks=pytest.mark.skipif(
+        semantic_text_splitter is None, reason="semantic-text-splitter not installed"
+    )),
+    pytest.param(False, id="langchain"),
+]
+
+KOREAN_TEXT = "시스템은 사용자 로그인 기능을 제공해야 한다. 관리자는 권한을 설정할 수 있다.\n\n" * 100
+
+
+@pytest.mark.parametrize("use_native", BACKENDS)
+def test_split_respects_chunk_size(use_native):
+    """Chunks should never exceed the strategy's chunk_size."""
+    chunker = TextChunker(use_native=use_native)
+    chunks = chunker.split(KOREAN_TEXT, doc_type="dev_request")
+
+    assert len(chunks) > 1
+    limit = CHUNK_STRATEGIES["dev_request"]["chunk_size"]
+    assert all(len(c.content) <= limit for c in chunks)
+
+
+@pytest.mark.parametrize("use_native", BACKENDS)
+def test_split_attaches_metadata_and_index(use_native):
+    """Each chunk carries the caller's metadata plus its position."""
+    chunker = TextChunker(use_native=use_native)
+    chunks = chunker.split(KOREAN_TEXT, metadata={"document_id": "doc-1"})
+
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+    for c in chunks:
+        assert c.metadata["document_id"] == "doc-1"
+        assert c.chunk_metadata() == {"document_id": "doc-1", "chunk_index": c.index}
+
+
+@pytest.mark.parametrize("use_native", BACKENDS)
+def test_split_unknown_doc_type_uses_default(use_native):
+    """An unknown doc_type should fall back to the default strategy."""
+    chunker = TextChunker(use_native=use_native)
+    assert [c.content for c in chunker.split(KOREAN_TEXT, doc_type="unknown")] == [
+        c.content for c in chunker.split(KOREAN_TEXT, doc_type="default")
+    ]
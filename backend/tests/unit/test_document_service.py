@@ -0,0 +1,80 @@
+"""Unit tests for copying uploads to disk."""
+
+from __future__ import annotations
+
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.config import settings
+from app.services import document_service
+from app.services.document_service import DocumentService, _copy_to_path
+
+SOURCE = bytes(range(256)) * 40 + b"tail"
+
+
+class TrickleReader(io.BytesIO):
+    """BytesIO that never returns more than a few bytes per read."""
+
+    def read(self, size: int = -1) -> bytes:
+        return super().read(min(size, 7) if size >= 0 else 7)
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(document_service, "UPLOAD_BLOCK_SIZE", 1000)
+
+
+def test_copy_short_reads(tmp_path, small_blocks):
+    """Reads returning fewer bytes than asked should still copy everything."""
+    dest = tmp_path / "upload.bin"
+    assert _copy_to_path(TrickleReader(SOURCE), dest) == len(SOURCE)
+    assert dest.read_bytes() == SOURCE
+
+
+def test_copy_partial_writes(tmp_path, small_blocks, monkeypatch):
+    """os.write accepting only part of a block should be retried for the rest."""
+    real_write = os.write
+    calls = []
+
+    def partial_write(fd, data):
+        calls.append(len(data))
+        return real_write(fd, data[:333])
+
+    monkeypatch.setattr(os, "write", partial_write)
+    dest = tmp_path / "upload.bin"
+    assert _copy_to_path(io.BytesIO(SOURCE), dest) == len(SOURCE)
+    assert dest.read_bytes() == SOURCE
+    assert len(calls) > len(SOURCE) // 1000 + 1
+
+
+def test_copy_empty_upload(tmp_path):
+    """An empty upload should produce an empty file."""
+    dest = tmp_path / "upload.bin"
+    dest.write_bytes(b"stale")
+    assert _copy_to_path(io.BytesIO(b""), dest, 0) == 0
+    assert dest.read_bytes() == b""
+
+
+async def test_upload_through_mmap(db_session, sample_project, tmp_path, small_blocks, monkeypatch):
+    """Uploads above MMAP_THRESHOLD go through mmap and keep their exact size."""
+    monkeypatch.setattr(document_service, "MMAP_THRESHOLD", 1024)
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    mmap_sizes = []
+    real_copy_to_mmap = document_service._copy_to_mmap
+
+    def spy(src, dest, size):
+        mmap_sizes.append(size)
+        return real_copy_to_mmap(src, dest, size)
+
+    monkeypatch.setattr(document_service, "_copy_to_mmap", spy)
+    upload = UploadFile(io.BytesIO(SOURCE), size=len(SOURCE), filename="odd.bin")
+
+    document = await DocumentService(db_session).upload_document(
+        sample_project.id, "Odd", "other", "odd.bin", upload, "application/octet-stream",
+    )
+    assert mmap_sizes == [len(SOURCE)]
+    assert document.file_size == len(SOURCE)
+    assert (tmp_path / str(sample_project.id) / "odd.bin").read_bytes() == SOURCE
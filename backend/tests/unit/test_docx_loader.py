@@ -0,0 +1,95 @@
+"""Unit tests for DOCX text extraction."""
+
+from __future__ import annotations
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+from app.rag.loaders.docx_loader import extract_docx
+
+# A run holding a text box, stored twice by Word (Choice and Fallback)
+TEXT_BOX_RUN = """
+<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+     xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+     xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+     xmlns:v="urn:schemas-microsoft-com:vml">
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps">
+      <wps:txbx><w:txbxContent><w:p><w:r><w:t>BOXTEXT</w:t></w:r></w:p></w:txbxContent></wps:txbx>
+    </mc:Choice>
+    <mc:Fallback>
+      <v:textbox><w:txbxContent><w:p><w:r><w:t>BOXTEXT</w:t></w:r></w:p></w:txbxContent></v:textbox>
+    </mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    path = tmp_path / "sample.docx"
+
+    def build(fill) -> str:
+        doc = Document()
+        fill(doc)
+        doc.save(path)
+        return str(path)
+
+    return build
+
+
+def test_extract_headings(docx_path):
+    """Heading styles should become markdown heading prefixes."""
+    def fill(doc):
+        doc.add_heading("Overview", level=1)
+        doc.add_heading("Scope", level=2)
+        doc.add_paragraph("Body text")
+
+    loaded = extract_docx(docx_path(fill))
+    assert loaded.text == "# Overview\n\n## Scope\n\nBody text"
+    assert loaded.metadata == {"paragraph_count": 3, "table_count": 0}
+
+
+def test_extract_tables(docx_path):
+    """Tables should be appended after the paragraphs, one row per line."""
+    def fill(doc):
+        doc.add_paragraph("Intro")
+        table = doc.add_table(rows=2, cols=2)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = f"r{r}c{c}"
+
+    loaded = extract_docx(docx_path(fill))
+    assert loaded.text == "Intro\n\n[Table 1]\nr0c0 | r0c1\nr1c0 | r1c1"
+    assert loaded.metadata["table_count"] == 1
+
+
+def test_extract_tabs_and_breaks(docx_path):
+    """Tabs and line breaks should match python-docx; page breaks add no text."""
+    def fill(doc):
+        run = doc.add_paragraph().add_run("a")
+        run.add_tab()
+        run.add_text("b")
+        run.add_break()
+        run.add_text("c")
+        run.add_break(WD_BREAK.PAGE)
+        run.add_text("d")
+
+    path = docx_path(fill)
+    loaded = extract_docx(path)
+    assert loaded.text == "a\tb\ncd"
+    assert loaded.text == Document(path).paragraphs[0].text
+
+
+def test_extract_skips_text_box_content(docx_path):
+    """Text nested in a run's text box is not part of the paragraph text."""
+    def fill(doc):
+        paragraph = doc.add_paragraph("Before ")
+        paragraph._p.append(parse_xml(TEXT_BOX_RUN))
+
+    path = docx_path(fill)
+    loaded = extract_docx(path)
+    assert loaded.text == "Before "
+    assert loaded.text == Document(path).paragraphs[0].text
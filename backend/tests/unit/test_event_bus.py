@@ -0,0 +1,93 @@
+"""Unit tests for the Redis event bus."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+from fakeredis import aioredis
+
+from app.config import settings
+from app.orchestration.event_bus import EventBus
+from app.orchestration.events import Event
+
+
+@pytest.fixture
+def redis_client():
+    return aioredis.FakeRedis()
+
+
+@pytest.fixture
+def bus(redis_client):
+    return EventBus(redis_client)
+
+
+async def read_stream(redis_client) -> list[dict]:
+    return [orjson.loads(fields[b"d"]) for _id, fields in await redis_client.xrange(EventBus.STREAM_KEY)]
+
+
+async def test_oversize_event_truncated_in_stream_only(bus, redis_client):
+    """An oversize event loses its state in the stream but not on PubSub."""
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(bus._channel_for_project("p1"))
+    await pubsub.get_message(timeout=1)  # subscribe confirmation
+
+    state = "x" * (settings.event_stream_max_payload_bytes + 1)
+    await bus.publish("agent.step", {"node": "plan", "state": state}, project_id="p1")
+
+    message = await pubsub.get_message(timeout=1)
+    assert orjson.loads(message["data"])["data"] == {"node": "plan", "state": state}
+    await pubsub.aclose()
+
+    [entry] = await read_stream(redis_client)
+    assert entry == {
+        "event_type": "agent.step",
+        "project_id": "p1",
+        "data": {"node": "plan"},
+        "truncated": True,
+    }
+
+
+async def test_publish_nowait_waits_when_queue_full(bus, redis_client, monkeypatch):
+    """A full queue blocks the producer until the drain task frees room; nothing is dropped."""
+    bus.QUEUE_MAXSIZE = 2
+    gate = asyncio.Event()
+    real_publish_many = bus.publish_many
+
+    async def gated_publish_many(events):
+        await gate.wait()
+        await real_publish_many(events)
+
+    monkeypatch.setattr(bus, "publish_many", gated_publish_many)
+    events = [Event(event_type="agent.progress", project_id="p1", data={"n": n}) for n in range(6)]
+
+    async def produce():
+        for event in events:
+            await bus.publish_nowait(event)
+
+    producer = asyncio.create_task(produce())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not producer.done()
+    assert bus._queue.full()
+
+    gate.set()
+    await producer
+    await bus.close()
+    assert [entry["data"]["n"] for entry in await read_stream(redis_client)] == list(range(6))
+
+
+async def test_close_drains_queue_and_cancels_task(bus, redis_client):
+    """close() should deliver everything queued, then cancel the drain task."""
+    for n in range(5):
+        await bus.publish_nowait(Event(event_type="agent.progress", project_id="p1", data={"n": n}))
+    drain_task = bus._drain_task
+
+    await bus.close()
+    await asyncio.gather(drain_task, return_exceptions=True)
+    assert drain_task.cancelled()
+    assert bus._drain_task is None
+    assert [entry["data"]["n"] for entry in await read_stream(redis_client)] == list(range(5))
+
+    await bus.close()  # nothing left to stop
@@ -51,18 +51,25 @@ async def test_get_project_not_found(db_session):
 
 
 async def test_list_projects_pagination(db_session):
-    """list_projects should respect offset and limit."""
+    """Following the (created_at, id) cursor should visit every project once, newest first."""
     service = ProjectService(db_session)
+    created = []
     for i in range(5):
-        await service.create_project(ProjectCreate(name=f"Proj-{i}"))
+        created.append(await service.create_project(ProjectCreate(name=f"Proj-{i}")))
     await db_session.commit()
 
-    projects, total = await service.list_projects(offset=0, limit=3)
-    assert total == 5
-    assert len(projects) == 3
+    seen = []
+    cursor = None
+    for _ in range(4):  # 3 pages of 2, then an empty one; bounded in case the cursor repeats
+        projects, total = await service.list_projects(cursor=cursor, limit=2)
+        assert total == 5
+        if not projects:
+            break
+        seen.extend(p.name for p in projects)
+        cursor = (projects[-1].created_at, projects[-1].id)
 
-    projects2, _ = await service.list_projects(offset=3, limit=3)
-    assert len(projects2) == 2
+    expected = sorted(created, key=lambda p: (p.created_at, p.id), reverse=True)
+    assert seen == [p.name for p in expected]
 
 
 async def test_start_project(db_session):
@@ -75,7 +82,8 @@ async def test_start_project(db_session):
     assert started.status == "analysis"
     assert started.current_phase == "analysis"
 
-    analysis_phase = next(p for p in started.phases if p.phase_type == "analysis")
+    fetched = await service.get_project(project.id)
+    analysis_phase = next(p for p in fetched.phases if p.phase_type == "analysis")
     assert analysis_phase.status == "ready"
 
 
@@ -27,9 +27,10 @@ export interface PaginatedResponse<T> {
   success: true;
   data: T[];
   meta: {
-    page: number;
+    page?: number;
     page_size: number;
     total: number;
+    next_cursor?: string | null;
   };
 }
 
@@ -314,11 +315,12 @@ async function unwrapPaginated<T>(promise: Promise<PaginatedResponse<T>>): Promi
 
 /** Projects CRUD + workflow actions. */
 export const projectsApi = {
-  /** List projects with pagination. */
-  list(page = 1, pageSize = 20) {
+  /** List projects newest first; pass `meta.next_cursor` to get the next page. */
+  list(pageSize = 20, cursor?: string) {
+    const query = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
     return unwrapPaginated(
       apiFetch<PaginatedResponse<ProjectResponse>>(
-        `/projects?page=${page}&page_size=${pageSize}`,
+        `/projects?page_size=${pageSize}${query}`,
       ),
     );
   },